@@ -18,10 +18,11 @@ import {
   type TimestampAnchor,
 } from "../engine/timestamp.js";
 import { loadConfigOrDefault } from "../models/config.js";
-import type {
-  AuditEvent,
-  AuditSeverity,
-  EventType,
+import {
+  type AuditEvent,
+  type AuditSeverity,
+  type EventType,
+  localTimeOfDay,
 } from "../models/audit.js";
 import { withDb, resolveSessionId } from "./shared.js";
 import { output, outputError, resolveJsonOption } from "./output.js";
@@ -73,7 +74,7 @@ function printEvent(event: AuditEvent): void {
   };
   const displayType = displayEventType(event.eventType);
   const colorFn = typeColor[displayType] ?? chalk.white;
-  const time = new Date(event.timestamp).toTimeString().slice(0, 8);
+  const time = localTimeOfDay(event.timestamp);
 
   console.log(
     `${chalk.dim(time)} ${chalk.cyan(agent.padStart(10))} ${colorFn(displayType.padEnd(15))} ${event.action}`,
@@ -490,7 +491,7 @@ export function registerAuditCommands(program: Command): void {
             ? result.agentNameById.get(event.agentId) ?? event.agentId.slice(0, 8) + "..."
             : "system";
           table.push([
-            new Date(event.timestamp).toTimeString().slice(0, 8),
+            localTimeOfDay(event.timestamp),
             String(event.sequence),
             chalk.dim(deltaBySeq.get(event.sequence) ?? "—"),
             agentLabel,
@@ -66,6 +66,15 @@ import { readDashboardPid } from "./team.js";
 const MAX_STDIN_BYTES = 1_048_576;
 const MAX_DURATION_MS = 3_600_000;
 
+const WRITE_TOOLS: ReadonlySet<string> = new Set(["Write", "Edit", "Bash", "MultiEdit"]);
+
+// Claude Code internal meta-tools (task tracking, etc.).
+// These add noise and have no governance value.
+const INTERNAL_TOOLS: ReadonlySet<string> = new Set([
+  "TaskCreate", "TaskUpdate", "TaskDone", "TaskDelete",
+  "TodoRead", "TodoWrite",
+]);
+
 function readHookInput(): Record<string, unknown> {
   try {
     const chunks: Buffer[] = [];
@@ -710,17 +719,11 @@ export function registerHookCommands(program: Command): void {
 
     const toolName = (data.tool_name as string) ?? "unknown";
     const toolInput = data.tool_input as Record<string, unknown> | undefined;
-    const WRITE_TOOLS = new Set(["Write", "Edit", "Bash", "MultiEdit"]);
     const isWriteOp = WRITE_TOOLS.has(toolName);
     // Claude Code sends tool output as "tool_response".
     const toolResponse = data.tool_response ?? data.tool_result ?? data.result;
 
-    // Skip Claude Code internal meta-tools (task tracking, etc.).
-    // These add noise and have no governance value.
-    const INTERNAL_TOOLS = new Set([
-      "TaskCreate", "TaskUpdate", "TaskDone", "TaskDelete",
-      "TodoRead", "TodoWrite",
-    ]);
+    // Skip Claude Code internal meta-tools.
     if (INTERNAL_TOOLS.has(toolName)) return;
 
     const filesAffected: string[] = [];
@@ -1033,7 +1036,7 @@ export function registerHookCommands(program: Command): void {
             : fp;
           const ruleIds = matcher.matchingRules(relative);
           for (const ruleId of ruleIds) {
-            const ruleConfig = config.gates?.find((g) => g.id === ruleId);
+            const ruleConfig = matcher.getRule(ruleId);
             const ruleName = ruleConfig?.name ?? ruleId;
             logger.start();
             logger.log({
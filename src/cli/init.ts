@@ -2,10 +2,10 @@ import { existsSync, mkdirSync, readFileSync, writeFileSync } from 'node:fs';
 import path from 'node:path';
 import { Command } from 'commander';
 import chalk from 'chalk';
-import YAML, { Document, isNode, isSeq } from 'yaml';
+import { Document, isNode, isSeq } from 'yaml';
 import { isPluginInstalled } from '../daemon/manager.js';
 import { generateSigningKey } from '../engine/signing.js';
-import { generateDefaultConfig } from '../models/config.js';
+import { configToYaml, generateDefaultConfig } from '../models/config.js';
 import { getPreset, listPresets, type PresetMeta } from '../presets/index.js';
 import { runAllChecks, printCheckResults } from '../engine/doctor.js';
 import { output, outputError, resolveJsonOption } from './output.js';
@@ -150,8 +150,7 @@ export function registerInitCommand(program: Command): void {
           writeFileSync(configFile, yamlContent);
         } else {
           const config = generateDefaultConfig(projectName);
-          const yaml = YAML.stringify(config, { sortMapEntries: false });
-          writeFileSync(configFile, yaml);
+          writeFileSync(configFile, configToYaml(config));
         }
         console.log(chalk.green('✓') + ' Created k6s.yaml');
 
@@ -5,13 +5,15 @@
  * better-sqlite3 is synchronous — writes succeed or throw immediately.
  */
 
-import { ulid } from "ulid";
 import path from "node:path";
 import type { Db } from "../store/db.js";
+import { newId } from "../models/ids.js";
+import { nowIso } from "../models/time.js";
 import {
   type AuditEvent,
   type AuditSeverity,
   type EventType,
+  AUDIT_EVENT_COLUMNS,
   auditEventFromDbRow,
   auditEventToDbRow,
 } from "../models/audit.js";
@@ -27,8 +29,13 @@ export function setWebhookDispatcher(dispatcher: WebhookDispatcher | null): void
   globalWebhookDispatcher = dispatcher;
 }
 
+// Upper bound on per-event JSON fragments memoized by getEventsJson().
+const EVENT_JSON_CACHE_MAX = 200;
+
 export class AuditLogger {
-  private sequence = 0;
+  // Audit events are append-only and never mutated after insert, so their
+  // serialized form can be reused across reads without invalidation.
+  private eventJsonCache = new Map<string, string>();
   private lastHmac: string | null = null;
   private autoTimestamping:
     | {
@@ -52,31 +59,31 @@ export class AuditLogger {
     // Sequence and HMAC chain state are now loaded atomically inside log()
     // via an IMMEDIATE transaction, so no pre-loading is needed here.
 
+    // Only the timestamping block matters here; let SQLite extract it
+    // instead of parsing the whole config snapshot in JS.
     const sessionRow = this.db.fetchOne(
-      "SELECT config_snapshot FROM sessions WHERE id = ?",
+      `SELECT CASE WHEN json_valid(config_snapshot)
+         THEN json_extract(config_snapshot, '$.observability.timestamping')
+       END AS timestamping
+       FROM sessions WHERE id = ?`,
       [this.sessionId],
     );
-    const snapshot = typeof sessionRow?.config_snapshot === "string"
-      ? sessionRow.config_snapshot
+    const timestamping = typeof sessionRow?.timestamping === "string"
+      ? sessionRow.timestamping
       : null;
-    if (!snapshot) {
+    if (!timestamping) {
       this.autoTimestamping = null;
       return;
     }
     try {
-      const parsed = JSON.parse(snapshot) as {
-        observability?: {
-          timestamping?: {
-            enabled?: boolean;
-            authority_url?: string;
-            interval_events?: number;
-            strict_verify?: boolean;
-            ca_cert_file?: string;
-            tsa_cert_file?: string;
-          };
-        };
-      };
-      const ts = parsed.observability?.timestamping;
+      const ts = JSON.parse(timestamping) as {
+        enabled?: boolean;
+        authority_url?: string;
+        interval_events?: number;
+        strict_verify?: boolean;
+        ca_cert_file?: string;
+        tsa_cert_file?: string;
+      } | null;
       const intervalEvents = Number(ts?.interval_events ?? 0);
       const isEnabled = ts?.enabled === true;
       if (!isEnabled || !Number.isFinite(intervalEvents) || intervalEvents <= 0) {
@@ -113,7 +120,9 @@ export class AuditLogger {
     // Each hook invocation is a separate process, so in-memory counters
     // race under concurrent agent activity. An IMMEDIATE transaction
     // acquires a write lock before reading MAX(sequence), preventing
-    // two processes from obtaining the same value.
+    // two processes from obtaining the same value. The read is a single
+    // seek on idx_audit_session_seq_unique, so it is not worth trading
+    // for a process-local counter.
     const event = this.db.transactionImmediate(() => {
       const row = this.db.fetchOne(
         "SELECT sequence, hmac FROM audit_events WHERE session_id = ? ORDER BY sequence DESC LIMIT 1",
@@ -121,15 +130,15 @@ export class AuditLogger {
       );
       const currentMax = (row?.sequence as number) ?? 0;
       const currentHmac = (row?.hmac as string) ?? null;
-      this.sequence = currentMax + 1;
+      const sequence = currentMax + 1;
       if (currentHmac !== null) {
         this.lastHmac = currentHmac;
       }
 
       const ev: AuditEvent = {
-        id: ulid(),
-        timestamp: new Date().toISOString(),
-        sequence: this.sequence,
+        id: newId(),
+        timestamp: nowIso(),
+        sequence,
         sessionId: this.sessionId,
         agentId: opts.agentId ?? null,
         eventType: opts.eventType,
@@ -155,7 +164,7 @@ export class AuditLogger {
         this.lastHmac = ev.hmac;
       }
 
-      this.db.insert("audit_events", auditEventToDbRow(ev));
+      this.db.insertColumns("audit_events", AUDIT_EVENT_COLUMNS, auditEventToDbRow(ev));
       return ev;
     });
 
@@ -243,7 +252,31 @@ export class AuditLogger {
     const sql = `SELECT * FROM audit_events WHERE ${where} ORDER BY sequence DESC LIMIT ? OFFSET ?`;
     params.push(limit, offset);
 
-    return this.db.fetchAll(sql, params).map(auditEventFromDbRow);
+    return this.db.fetchAllAs(sql, params, auditEventFromDbRow);
+  }
+
+  /**
+   * Serialize the most recent events to a JSON array string. Equivalent to
+   * `JSON.stringify(getEvents({ limit }))`, but reuses cached per-event
+   * fragments for events that were already serialized.
+   */
+  getEventsJson(limit = 50): string {
+    const events = this.getEvents({ limit });
+    const parts: string[] = new Array(events.length);
+    for (let i = 0; i < events.length; i++) {
+      const event = events[i];
+      let json = this.eventJsonCache.get(event.id);
+      if (json === undefined) {
+        json = JSON.stringify(event);
+        if (this.eventJsonCache.size >= EVENT_JSON_CACHE_MAX) {
+          const oldest = this.eventJsonCache.keys().next().value;
+          if (oldest !== undefined) this.eventJsonCache.delete(oldest);
+        }
+        this.eventJsonCache.set(event.id, json);
+      }
+      parts[i] = json;
+    }
+    return `[${parts.join(",")}]`;
   }
 
   getEventCount(): number {
@@ -310,7 +343,7 @@ export function pruneSessions(
     return { sessionsPruned: 0 };
   }
 
-  db.transaction(() => {
+  db.transactionImmediate(() => {
     for (const sid of staleSessionIds) {
       for (const table of [
         "audit_events",
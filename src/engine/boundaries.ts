@@ -11,9 +11,12 @@ import type { Db } from "../store/db.js";
 import type { BoundaryConfig } from "../models/config.js";
 import {
   type BoundaryViolation,
+  BOUNDARY_VIOLATION_COLUMNS,
   boundaryViolationFromDbRow,
   boundaryViolationToDbRow,
 } from "../models/context.js";
+import { toPosixPath } from "../models/paths.js";
+import { nowIso } from "../models/time.js";
 import { recordBoundaryViolation } from "./telemetry.js";
 
 export function revertFile(filePath: string, projectRoot: string): string | null {
@@ -77,17 +80,52 @@ export function revertFile(filePath: string, projectRoot: string): string | null
   }
 }
 
+const AGENT_BOUNDARY_CACHE_MAX = 1024;
+
+interface CompiledPathRules {
+  forbidden: Array<[pattern: string, matches: picomatch.Matcher]>;
+  allowed: picomatch.Matcher[];
+}
+
+function compilePathRules(boundary: BoundaryConfig): CompiledPathRules {
+  return {
+    forbidden: boundary.forbidden_paths.map(
+      (p): [string, picomatch.Matcher] => [p, picomatch(p, { dot: true })],
+    ),
+    allowed: boundary.allowed_paths.map((p) => picomatch(p, { dot: true })),
+  };
+}
+
 export class BoundaryEnforcer {
+  // Agent-name and path matchers compiled once; picomatch.isMatch
+  // recompiles the glob on every call.
+  private agentMatchers: Array<[matcher: picomatch.Matcher, boundary: BoundaryConfig]>;
+  private pathRules = new Map<BoundaryConfig, CompiledPathRules>();
+  private boundaryByAgent = new Map<string, BoundaryConfig | null>();
+
   constructor(
     private db: Db,
     private sessionId: string,
     private projectRoot: string,
     private boundaries: BoundaryConfig[],
-  ) {}
+  ) {
+    this.agentMatchers = boundaries.map(
+      (b): [picomatch.Matcher, BoundaryConfig] => [picomatch(b.pattern), b],
+    );
+  }
 
   getBoundaryForAgent(agentName: string): BoundaryConfig | null {
-    for (const b of this.boundaries) {
-      if (picomatch.isMatch(agentName, b.pattern)) return b;
+    const cached = this.boundaryByAgent.get(agentName);
+    if (cached !== undefined) return cached;
+    const boundary = this.resolveBoundaryForAgent(agentName);
+    if (this.boundaryByAgent.size >= AGENT_BOUNDARY_CACHE_MAX) this.boundaryByAgent.clear();
+    this.boundaryByAgent.set(agentName, boundary);
+    return boundary;
+  }
+
+  private resolveBoundaryForAgent(agentName: string): BoundaryConfig | null {
+    for (const [matches, b] of this.agentMatchers) {
+      if (matches(agentName)) return b;
     }
     for (const b of this.boundaries) {
       if (b.pattern === "*") return b;
@@ -137,19 +175,25 @@ export class BoundaryEnforcer {
     }
 
     // Normalize to posix for matching
-    const posixPath = rel.split(path.sep).join("/");
+    const posixPath = toPosixPath(rel);
+
+    let rules = this.pathRules.get(boundary);
+    if (!rules) {
+      rules = compilePathRules(boundary);
+      this.pathRules.set(boundary, rules);
+    }
 
     // Check forbidden paths first (they take precedence)
-    for (const pattern of boundary.forbidden_paths) {
-      if (picomatch.isMatch(posixPath, pattern, { dot: true })) {
+    for (const [pattern, matches] of rules.forbidden) {
+      if (matches(posixPath)) {
         return [false, `Path matches forbidden pattern: ${pattern}`];
       }
     }
 
     // If allowed_paths is specified, path must match at least one
-    if (boundary.allowed_paths.length > 0) {
-      for (const pattern of boundary.allowed_paths) {
-        if (picomatch.isMatch(posixPath, pattern, { dot: true })) {
+    if (rules.allowed.length > 0) {
+      for (const matches of rules.allowed) {
+        if (matches(posixPath)) {
           return [true, null];
         }
       }
@@ -173,14 +217,18 @@ export class BoundaryEnforcer {
       id: ulid(),
       sessionId: this.sessionId,
       agentId: opts.agentId ?? null,
-      timestamp: new Date().toISOString(),
+      timestamp: nowIso(),
       filePath: opts.filePath,
       violationType: opts.violationType,
       enforcementAction: opts.enforcementAction,
       details: opts.details ? JSON.stringify(opts.details) : null,
     };
 
-    this.db.insert("boundary_violations", boundaryViolationToDbRow(violation));
+    this.db.insertColumns(
+      "boundary_violations",
+      BOUNDARY_VIOLATION_COLUMNS,
+      boundaryViolationToDbRow(violation),
+    );
     recordBoundaryViolation(opts.violationType);
     return violation;
   }
@@ -188,22 +236,22 @@ export class BoundaryEnforcer {
   getViolations(agentId?: string, limit = 100): BoundaryViolation[] {
     if (agentId) {
       return this.db
-        .fetchAll(
+        .fetchAllAs(
           `SELECT * FROM boundary_violations
          WHERE session_id = ? AND agent_id = ?
          ORDER BY timestamp DESC LIMIT ?`,
           [this.sessionId, agentId, limit],
-        )
-        .map(boundaryViolationFromDbRow);
+          boundaryViolationFromDbRow,
+        );
     }
     return this.db
-      .fetchAll(
+      .fetchAllAs(
         `SELECT * FROM boundary_violations
        WHERE session_id = ?
        ORDER BY timestamp DESC LIMIT ?`,
         [this.sessionId, limit],
-      )
-      .map(boundaryViolationFromDbRow);
+        boundaryViolationFromDbRow,
+      );
   }
 
   getAgentBoundariesSummary(agentName: string): Record<string, unknown> {
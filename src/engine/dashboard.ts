@@ -30,6 +30,8 @@ export interface DashboardServerOptions {
 /** Hosts that are safe to bind without explicit opt-in. */
 const SAFE_HOSTS = new Set(["localhost", "127.0.0.1", "::1"]);
 
+type RouteHandler = (req: IncomingMessage, res: ServerResponse, url: URL) => void;
+
 interface SSEClient {
   res: ServerResponse;
   id: number;
@@ -49,6 +51,21 @@ export class DashboardServer {
   /** Bearer token required for the /api/push endpoint. */
   readonly pushToken: string;
 
+  /** Dispatch table keyed by "METHOD /pathname". */
+  private readonly routes: ReadonlyMap<string, RouteHandler> = new Map<string, RouteHandler>([
+    ["GET /", (_req, res) => this.serveHTML(res)],
+    ["GET /events", (req, res) => this.serveSSE(req, res)],
+    ["GET /api/events", (_req, res, url) => this.apiEvents(url, res)],
+    ["GET /api/sessions", (_req, res) => this.apiSessions(res)],
+    ["GET /api/cost", (_req, res) => this.apiCost(res)],
+    ["GET /api/agents", (_req, res) => this.apiAgents(res)],
+    ["GET /api/review", (_req, res) => this.apiReview(res)],
+    ["GET /api/transcript", (_req, res, url) => this.apiTranscript(url, res)],
+    ["GET /api/export/events", (_req, res, url) => this.apiExportEvents(url, res)],
+    ["GET /api/export/report", (_req, res, url) => this.apiExportReport(url, res)],
+    ["POST /api/push", (req, res) => this.apiPush(req, res)],
+  ]);
+
   constructor(private opts: DashboardServerOptions) {
     // Use token from env (set by team.ts daemon launcher) or generate a new one.
     this.pushToken = process.env.K6S_DASHBOARD_PUSH_TOKEN || randomBytes(24).toString("hex");
@@ -162,6 +179,10 @@ export class DashboardServer {
   }
 
   private pollNewRows(): void {
+    // Nothing to deliver without subscribers; serveSSE() moves the
+    // cursors forward when the first client connects.
+    if (this.clients.size === 0) return;
+
     const { db } = this.opts;
     const sessionId = this.opts.sessionId;
 
@@ -212,6 +233,24 @@ export class DashboardServer {
     }
   }
 
+  private skipToLatestRows(): void {
+    const { db, sessionId } = this.opts;
+    try {
+      const audit = db.fetchOne(
+        "SELECT MAX(rowid) AS max_rowid FROM audit_events WHERE session_id = ?",
+        [sessionId],
+      );
+      const cost = db.fetchOne(
+        "SELECT MAX(rowid) AS max_rowid FROM cost_records WHERE session_id = ?",
+        [sessionId],
+      );
+      this.lastAuditRowId = Math.max(this.lastAuditRowId, Number(audit?.max_rowid ?? 0));
+      this.lastCostRowId = Math.max(this.lastCostRowId, Number(cost?.max_rowid ?? 0));
+    } catch {
+      // DB might be locked; the next poll catches up instead.
+    }
+  }
+
   private rowToEvent(row: Record<string, unknown>): Record<string, unknown> {
     let details: unknown = null;
     if (typeof row.details === "string") {
@@ -251,38 +290,9 @@ export class DashboardServer {
     // so cross-origin access is intentionally denied to prevent
     // exfiltration of audit data by malicious websites.
 
-    if (pathname === "/" && req.method === "GET") {
-      return this.serveHTML(res);
-    }
-    if (pathname === "/events" && req.method === "GET") {
-      return this.serveSSE(req, res);
-    }
-    if (pathname === "/api/events" && req.method === "GET") {
-      return this.apiEvents(url, res);
-    }
-    if (pathname === "/api/sessions" && req.method === "GET") {
-      return this.apiSessions(res);
-    }
-    if (pathname === "/api/cost" && req.method === "GET") {
-      return this.apiCost(res);
-    }
-    if (pathname === "/api/agents" && req.method === "GET") {
-      return this.apiAgents(res);
-    }
-    if (pathname === "/api/review" && req.method === "GET") {
-      return this.apiReview(res);
-    }
-    if (pathname === "/api/transcript" && req.method === "GET") {
-      return this.apiTranscript(url, res);
-    }
-    if (pathname === "/api/export/events" && req.method === "GET") {
-      return this.apiExportEvents(url, res);
-    }
-    if (pathname === "/api/export/report" && req.method === "GET") {
-      return this.apiExportReport(url, res);
-    }
-    if (pathname === "/api/push" && req.method === "POST") {
-      return this.apiPush(req, res);
+    const route = this.routes.get(`${req.method} ${pathname}`);
+    if (route) {
+      return route(req, res, url);
     }
 
     res.writeHead(404, { "Content-Type": "application/json" });
@@ -308,6 +318,9 @@ export class DashboardServer {
     });
     res.write(": connected\n\n");
 
+    // Rows written while nobody was subscribed are history; the page
+    // loads that from the API rather than replaying it over the stream.
+    if (this.clients.size === 0) this.skipToLatestRows();
     this.clients.set(clientId, { res, id: clientId });
 
     req.on("close", () => {
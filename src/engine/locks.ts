@@ -2,7 +2,8 @@
  * File lock manager for coordinating file access between agents.
  *
  * better-sqlite3 transactions are naturally serialized (single-threaded + sync),
- * so no TOCTOU race is possible.
+ * and acquire() takes the write lock up front, so no TOCTOU race is possible
+ * across hook processes either.
  */
 
 import type { Db } from "../store/db.js";
@@ -12,6 +13,7 @@ import {
   fileLockToDbRow,
   isLockExpired,
 } from "../models/context.js";
+import { nowIso } from "../models/time.js";
 
 export interface LockResult {
   success: boolean;
@@ -42,7 +44,7 @@ export class FileLockManager {
     agentId: string,
     durationSeconds?: number,
   ): LockResult {
-    return this.db.transaction(() => {
+    return this.db.transactionImmediate(() => {
       const row = this.db.fetchOne(
         "SELECT * FROM file_locks WHERE path = ? AND session_id = ?",
         [lockPath, this.sessionId],
@@ -84,7 +86,7 @@ export class FileLockManager {
         path: lockPath,
         sessionId: this.sessionId,
         agentId,
-        acquiredAt: new Date().toISOString(),
+        acquiredAt: nowIso(),
         expiresAt: new Date(Date.now() + duration * 1000).toISOString(),
       };
 
@@ -136,9 +138,9 @@ export class FileLockManager {
           this.sessionId,
         ]);
 
-    const locks = rows.map(fileLockFromDbRow);
     const active: FileLock[] = [];
-    for (const lock of locks) {
+    for (const row of rows) {
+      const lock = fileLockFromDbRow(row);
       if (isLockExpired(lock)) {
         this.deleteLock(lock.path);
       } else {
@@ -6,6 +6,7 @@ import { randomUUID } from "node:crypto";
 import { ulid } from "ulid";
 import type { TranscriptUsage } from "./transcript.js";
 import type { Db } from "../store/db.js";
+import { newId } from "../models/ids.js";
 import {
   type Session,
   type SessionState,
@@ -22,6 +23,10 @@ import {
   contextEntryFromDbRow,
   contextEntryToDbRow,
 } from "../models/context.js";
+import { nowIso } from "../models/time.js";
+
+// Saved-context entries shown in a resume summary.
+const RESUME_CONTEXT_ENTRIES = 10;
 
 export class StateManager {
   constructor(
@@ -40,7 +45,7 @@ export class StateManager {
       id: ulid(),
       objective: opts.objective,
       state: "created",
-      startedAt: new Date().toISOString(),
+      startedAt: nowIso(),
       endedAt: null,
       parentSessionId: opts.parentSessionId ?? null,
       configSnapshot: opts.configSnapshot ?? null,
@@ -102,39 +107,56 @@ export class StateManager {
 
     if (opts?.state) {
       return this.db
-        .fetchAll(
+        .fetchAllAs(
           "SELECT * FROM sessions WHERE state = ? ORDER BY started_at DESC LIMIT ? OFFSET ?",
           [opts.state, limit, offset],
-        )
-        .map(sessionFromDbRow);
+          sessionFromDbRow,
+        );
     }
     return this.db
-      .fetchAll(
+      .fetchAllAs(
         "SELECT * FROM sessions ORDER BY started_at DESC LIMIT ? OFFSET ?",
         [limit, offset],
-      )
-      .map(sessionFromDbRow);
+        sessionFromDbRow,
+      );
   }
 
   updateSession(session: Session): void {
     this.db.update("sessions", sessionToDbRow(session), "id = ?", [session.id]);
   }
 
-  markSessionActive(sessionId: string): void {
-    this.db.update("sessions", { state: "active" }, "id = ?", [sessionId]);
+  /**
+   * Session state transitions update and read back the row in one
+   * statement (UPDATE ... RETURNING), so callers that need the new state
+   * do not issue a follow-up getSession. Returns null for unknown ids.
+   */
+  markSessionActive(sessionId: string): Session | null {
+    return this.transitionSession(
+      "UPDATE sessions SET state = 'active' WHERE id = ? RETURNING *",
+      [sessionId],
+    );
+  }
+
+  markSessionPaused(sessionId: string): Session | null {
+    return this.transitionSession(
+      "UPDATE sessions SET state = 'paused' WHERE id = ? RETURNING *",
+      [sessionId],
+    );
   }
 
-  markSessionPaused(sessionId: string): void {
-    this.db.update("sessions", { state: "paused" }, "id = ?", [sessionId]);
+  markSessionCompleted(sessionId: string, summary?: string): Session | null {
+    return this.transitionSession(
+      `UPDATE sessions
+       SET state = 'completed', ended_at = ?,
+           context_summary = COALESCE(?, context_summary)
+       WHERE id = ? RETURNING *`,
+      [nowIso(), summary || null, sessionId],
+    );
   }
 
-  markSessionCompleted(sessionId: string, summary?: string): void {
-    const data: Record<string, unknown> = {
-      state: "completed",
-      ended_at: new Date().toISOString(),
-    };
-    if (summary) data.context_summary = summary;
-    this.db.update("sessions", data, "id = ?", [sessionId]);
+  private transitionSession(sql: string, params: unknown[]): Session | null {
+    const row = this.db.updateReturning(sql, params);
+    return row ? sessionFromDbRow(row) : null;
   }
 
   // Agent management
@@ -147,13 +169,13 @@ export class StateManager {
     boundaryConfig?: Record<string, unknown> | null;
   }): Agent {
     const agent: Agent = {
-      id: ulid(),
+      id: newId(),
       sessionId: opts.sessionId,
       name: opts.name,
       role: (opts.role as Agent["role"]) ?? "teammate",
       specialization: opts.specialization ?? null,
       state: "active",
-      spawnedAt: new Date().toISOString(),
+      spawnedAt: nowIso(),
       boundaryConfig: opts.boundaryConfig
         ? JSON.stringify(opts.boundaryConfig)
         : null,
@@ -213,11 +235,11 @@ export class StateManager {
 
   listAgents(sessionId: string): Agent[] {
     return this.db
-      .fetchAll(
+      .fetchAllAs(
         "SELECT * FROM agents WHERE session_id = ? ORDER BY spawned_at",
         [sessionId],
-      )
-      .map(agentFromDbRow);
+        agentFromDbRow,
+      );
   }
 
   updateAgent(agent: Agent): void {
@@ -225,11 +247,10 @@ export class StateManager {
   }
 
   incrementToolCallCount(agentId: string): number {
-    this.db.db
-      .prepare("UPDATE agents SET tool_call_count = tool_call_count + 1 WHERE id = ?")
-      .run(agentId);
-    const row = this.db.fetchOne(
-      "SELECT tool_call_count FROM agents WHERE id = ?",
+    // Single statement: the increment and the read-back cannot interleave
+    // with another process's write.
+    const row = this.db.updateReturning(
+      "UPDATE agents SET tool_call_count = tool_call_count + 1 WHERE id = ? RETURNING tool_call_count",
       [agentId],
     );
     return (row?.tool_call_count as number) ?? 0;
@@ -248,12 +269,39 @@ export class StateManager {
       sessionId: opts.sessionId,
       agentId: opts.agentId ?? null,
       value: opts.value,
-      updatedAt: new Date().toISOString(),
+      updatedAt: nowIso(),
     };
     this.db.insertOrReplace("context_store", contextEntryToDbRow(entry));
     return entry;
   }
 
+  /**
+   * Save several context entries for a session in one IMMEDIATE
+   * transaction, so the batch commits once instead of once per key.
+   */
+  saveContextMany(
+    sessionId: string,
+    entries: Array<{ key: string; value: string; agentId?: string | null }>,
+  ): ContextEntry[] {
+    const updatedAt = nowIso();
+    const saved = entries.map(
+      (e): ContextEntry => ({
+        key: e.key,
+        sessionId,
+        agentId: e.agentId ?? null,
+        value: e.value,
+        updatedAt,
+      }),
+    );
+    if (saved.length === 0) return saved;
+    this.db.transactionImmediate(() => {
+      for (const entry of saved) {
+        this.db.insertOrReplace("context_store", contextEntryToDbRow(entry));
+      }
+    });
+    return saved;
+  }
+
   loadContext(sessionId: string, key: string): ContextEntry | null {
     const row = this.db.fetchOne(
       "SELECT * FROM context_store WHERE session_id = ? AND key = ?",
@@ -265,18 +313,18 @@ export class StateManager {
   loadAllContext(sessionId: string, agentId?: string): ContextEntry[] {
     if (agentId) {
       return this.db
-        .fetchAll(
+        .fetchAllAs(
           "SELECT * FROM context_store WHERE session_id = ? AND agent_id = ? ORDER BY key",
           [sessionId, agentId],
-        )
-        .map(contextEntryFromDbRow);
+          contextEntryFromDbRow,
+        );
     }
     return this.db
-      .fetchAll(
+      .fetchAllAs(
         "SELECT * FROM context_store WHERE session_id = ? ORDER BY key",
         [sessionId],
-      )
-      .map(contextEntryFromDbRow);
+        contextEntryFromDbRow,
+      );
   }
 
   deleteContext(sessionId: string, key: string): void {
@@ -296,36 +344,39 @@ export class StateManager {
     auditEventId?: string | null;
   }): void {
     const id = ulid();
-    this.db.insert("cost_records", {
-      id,
-      session_id: opts.sessionId,
-      agent_id: opts.agentId,
-      task_id: null,
-      timestamp: new Date().toISOString(),
-      model: opts.usage.model,
-      input_tokens: opts.usage.inputTokens,
-      output_tokens: opts.usage.outputTokens,
-      estimated_cost_usd: opts.estimatedCostUsd,
-      cache_creation_input_tokens: opts.usage.cacheCreationInputTokens,
-      cache_read_input_tokens: opts.usage.cacheReadInputTokens,
-      audit_event_id: opts.auditEventId ?? null,
+    // The cost record and the session aggregates share one write transaction.
+    this.db.transactionImmediate(() => {
+      this.db.insert("cost_records", {
+        id,
+        session_id: opts.sessionId,
+        agent_id: opts.agentId,
+        task_id: null,
+        timestamp: nowIso(),
+        model: opts.usage.model,
+        input_tokens: opts.usage.inputTokens,
+        output_tokens: opts.usage.outputTokens,
+        estimated_cost_usd: opts.estimatedCostUsd,
+        cache_creation_input_tokens: opts.usage.cacheCreationInputTokens,
+        cache_read_input_tokens: opts.usage.cacheReadInputTokens,
+        audit_event_id: opts.auditEventId ?? null,
+      });
+
+      // Update session aggregates.
+      this.db.db
+        .prepare(
+          `UPDATE sessions
+           SET total_input_tokens = total_input_tokens + ?,
+               total_output_tokens = total_output_tokens + ?,
+               total_cost_usd = total_cost_usd + ?
+           WHERE id = ?`,
+        )
+        .run(
+          opts.usage.inputTokens,
+          opts.usage.outputTokens,
+          opts.estimatedCostUsd,
+          opts.sessionId,
+        );
     });
-
-    // Update session aggregates.
-    this.db.db
-      .prepare(
-        `UPDATE sessions
-         SET total_input_tokens = total_input_tokens + ?,
-             total_output_tokens = total_output_tokens + ?,
-             total_cost_usd = total_cost_usd + ?
-         WHERE id = ?`,
-      )
-      .run(
-        opts.usage.inputTokens,
-        opts.usage.outputTokens,
-        opts.estimatedCostUsd,
-        opts.sessionId,
-      );
   }
 
   getTranscriptOffset(sessionId: string): number {
@@ -345,11 +396,21 @@ export class StateManager {
   // Session summary for resumption
 
   generateResumeContext(sessionId: string): string {
-    const session = this.getSession(sessionId);
-    if (!session) return "";
-
-    const agents = this.listAgents(sessionId);
-    const contextEntries = this.loadAllContext(sessionId);
+    // One read transaction: a single snapshot for all three queries, and
+    // only the context entries that are rendered are fetched.
+    const snapshot = this.db.transaction(() => {
+      const session = this.getSession(sessionId);
+      if (!session) return null;
+      const agents = this.listAgents(sessionId);
+      const contextEntries = this.db.fetchAllAs(
+        `SELECT * FROM context_store WHERE session_id = ? ORDER BY key LIMIT ${RESUME_CONTEXT_ENTRIES}`,
+        [sessionId],
+        contextEntryFromDbRow,
+      );
+      return { session, agents, contextEntries };
+    });
+    if (!snapshot) return "";
+    const { session, agents, contextEntries } = snapshot;
 
     const lines: string[] = [
       "## Previous Session Context",
@@ -374,7 +435,7 @@ export class StateManager {
 
     if (contextEntries.length > 0) {
       lines.push("### Saved Context");
-      for (const entry of contextEntries.slice(0, 10)) {
+      for (const entry of contextEntries) {
         const preview =
           entry.value.length > 100
             ? entry.value.slice(0, 100) + "..."
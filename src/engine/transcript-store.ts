@@ -7,7 +7,7 @@
 
 import { openSync, readSync, closeSync } from "node:fs";
 import { ulid } from "ulid";
-import type { Db } from "../store/db.js";
+import type { Db, Row } from "../store/db.js";
 import type { TranscriptConfig } from "../models/config.js";
 import { readTranscriptIncremental } from "./transcript.js";
 import { redactFull, stripThinkingBlocks } from "./redaction.js";
@@ -221,9 +221,7 @@ export function ingestTranscript(opts: {
   // only extracts usage metadata, not full message content).
   const rawEntries = readRawLines(opts.transcriptPath, opts.byteOffset, newOffset);
 
-  let seq = nextSequence(opts.db, opts.sessionId);
-  let stored = 0;
-
+  const rows: Row[] = [];
   for (let i = 0; i < entries.length; i++) {
     const entry = entries[i];
     const raw = rawEntries[i] ?? {};
@@ -233,11 +231,11 @@ export function ingestTranscript(opts: {
 
     const { content, role, redacted } = extractContent(raw, opts.config);
 
-    opts.db.insert("transcript_entries", {
+    rows.push({
       id: ulid(),
       session_id: opts.sessionId,
       agent_id: opts.agentId,
-      sequence: seq++,
+      sequence: 0,
       entry_type: entry.type,
       role: role ?? (entry.type === "user" ? "user" : "assistant"),
       model: entry.model ?? null,
@@ -249,9 +247,16 @@ export function ingestTranscript(opts: {
       timestamp: entry.timestamp ?? new Date().toISOString(),
       redacted: redacted ? 1 : 0,
     });
-    stored++;
   }
 
+  // Assign sequences and insert the whole batch under one write lock, so
+  // concurrent hook processes cannot interleave sequence numbers.
+  const stored = opts.db.transactionImmediate(() => {
+    let seq = nextSequence(opts.db, opts.sessionId);
+    for (const row of rows) row.sequence = seq++;
+    return opts.db.insertMany("transcript_entries", rows);
+  });
+
   return { stored, newOffset };
 }
 
@@ -1,6 +1,5 @@
 import { existsSync, mkdirSync, readFileSync, writeFileSync } from "node:fs";
 import path from "node:path";
-import YAML from "yaml";
 import type { Db } from "../store/db.js";
 import { StateManager } from "../engine/state.js";
 import { generateAuditReport } from "../engine/report.js";
@@ -8,6 +7,8 @@ import { loadSigningKey, verifyChain, type VerifyResult } from "../engine/signin
 import { auditEventFromDbRow, type AuditEvent } from "../models/audit.js";
 import { agentFromDbRow, type Agent } from "../models/agent.js";
 import { boundaryViolationFromDbRow, contextEntryFromDbRow } from "../models/context.js";
+import { configToYaml } from "../models/config.js";
+import { toPosixPath } from "../models/paths.js";
 import { sessionDurationSeconds } from "../models/session.js";
 
 export interface GitExportOptions {
@@ -57,10 +58,6 @@ interface ReadmeSessionRow {
   violations: number;
 }
 
-function toPosixPath(value: string): string {
-  return value.split(path.sep).join(path.posix.sep);
-}
-
 function toRelativeOutputPath(projectRoot: string, absolutePath: string): string {
   const relative = path.relative(projectRoot, absolutePath);
   return toPosixPath(relative);
@@ -232,7 +229,7 @@ export function exportSessionToGit(
   const configSnapshotPath = path.join(sessionDir, "config-snapshot.yaml");
   const configSnapshotParsed = session.configSnapshot ? safeJsonParse(session.configSnapshot) : null;
   const configSnapshotYaml = configSnapshotParsed
-    ? YAML.stringify(configSnapshotParsed, { sortMapEntries: false })
+    ? configToYaml(configSnapshotParsed)
     : "null\n";
 
   const report = generateAuditReport(db, session.id, options.projectRoot, "generic");
@@ -32,6 +32,7 @@ const AGENT_EVENT_TYPES = [
   "task_update",
   "task_complete",
 ] as const satisfies readonly EventType[];
+const AGENT_EVENT_TYPE_SET: ReadonlySet<string> = new Set(AGENT_EVENT_TYPES);
 
 const INPUT_LIMITS = {
   action: 500,
@@ -48,51 +49,185 @@ const INPUT_LIMITS = {
   duration_seconds_max: 3600,
 } as const;
 
-function validateInput(
-  args: Record<string, unknown>,
-): string | null {
-  for (const [key, value] of Object.entries(args)) {
-    if (typeof value === "string") {
-      const limit = INPUT_LIMITS[key as keyof typeof INPUT_LIMITS] as
-        | number
-        | undefined;
-      if (limit && value.length > limit) {
-        return `Input '${key}' exceeds maximum length of ${limit} characters`;
-      }
-    }
-    if (key === "details" && typeof value === "object" && value !== null) {
-      const serialized = JSON.stringify(value);
-      if (serialized.length > INPUT_LIMITS.details_bytes) {
-        return `'details' exceeds maximum size of ${INPUT_LIMITS.details_bytes} bytes`;
-      }
-    }
-    if (key === "value") {
+type InputValidator = (args: Record<string, unknown>) => string | null;
+type FieldCheck = (value: unknown) => string | null;
+
+/**
+ * Build the limit checks that apply to a single input field. Returns null
+ * when the field has no limits, so it is skipped entirely at call time.
+ */
+function compileFieldCheck(key: string): FieldCheck | null {
+  const checks: FieldCheck[] = [];
+  const limit = INPUT_LIMITS[key as keyof typeof INPUT_LIMITS] as
+    | number
+    | undefined;
+  if (limit) {
+    checks.push((value) =>
+      typeof value === "string" && value.length > limit
+        ? `Input '${key}' exceeds maximum length of ${limit} characters`
+        : null);
+  }
+  if (key === "details") {
+    checks.push((value) =>
+      typeof value === "object" && value !== null
+        && JSON.stringify(value).length > INPUT_LIMITS.details_bytes
+        ? `'details' exceeds maximum size of ${INPUT_LIMITS.details_bytes} bytes`
+        : null);
+  }
+  if (key === "value") {
+    checks.push((value) => {
       const serialized =
         typeof value === "string" ? value : JSON.stringify(value);
-      if (serialized.length > INPUT_LIMITS.value_bytes) {
-        return `'value' exceeds maximum size of ${INPUT_LIMITS.value_bytes} bytes`;
-      }
-    }
-    if (key === "files" && Array.isArray(value)) {
-      if (value.length > INPUT_LIMITS.files_max) {
-        return `'files' list exceeds maximum of ${INPUT_LIMITS.files_max} entries`;
-      }
-    }
-    if (key === "duration_seconds" && typeof value === "number") {
-      if (value <= 0 || value > INPUT_LIMITS.duration_seconds_max) {
-        return `'duration_seconds' must be between 1 and ${INPUT_LIMITS.duration_seconds_max}`;
-      }
+      return serialized.length > INPUT_LIMITS.value_bytes
+        ? `'value' exceeds maximum size of ${INPUT_LIMITS.value_bytes} bytes`
+        : null;
+    });
+  }
+  if (key === "files") {
+    checks.push((value) =>
+      Array.isArray(value) && value.length > INPUT_LIMITS.files_max
+        ? `'files' list exceeds maximum of ${INPUT_LIMITS.files_max} entries`
+        : null);
+  }
+  if (key === "duration_seconds") {
+    checks.push((value) =>
+      typeof value === "number"
+        && (value <= 0 || value > INPUT_LIMITS.duration_seconds_max)
+        ? `'duration_seconds' must be between 1 and ${INPUT_LIMITS.duration_seconds_max}`
+        : null);
+  }
+  if (checks.length === 0) return null;
+  if (checks.length === 1) return checks[0];
+  return (value) => {
+    for (const check of checks) {
+      const err = check(value);
+      if (err) return err;
     }
+    return null;
+  };
+}
+
+/**
+ * Specialize input validation for a tool's known fields. The MCP SDK has
+ * already parsed the arguments against the tool's zod shape, so only
+ * fields with limits need to be visited, in schema order.
+ */
+function compileInputValidator(fields: readonly string[]): InputValidator {
+  const checks: Array<[key: string, check: FieldCheck]> = [];
+  for (const key of fields) {
+    const check = compileFieldCheck(key);
+    if (check) checks.push([key, check]);
   }
-  return null;
+  return (args) => {
+    for (const [key, check] of checks) {
+      const value = args[key];
+      if (value === undefined) continue;
+      const err = check(value);
+      if (err) return err;
+    }
+    return null;
+  };
+}
+
+// Tool descriptions and input schemas. Built once at module load and
+// shared by every K6sServer instance instead of per registration.
+const TOOL_DEFINITIONS = {
+  k6s_log: {
+    description: "Log an action to the audit trail. Call this before and after significant actions.",
+    inputSchema: {
+      action: z.string().describe("Human-readable description of the action"),
+      event_type: z.enum(AGENT_EVENT_TYPES).optional().describe("Type of event (log, file_create, file_modify, file_delete, task_create, task_update, task_complete)"),
+      agent_name: z.string().optional().describe("Name of the agent performing the action"),
+      details: z.record(z.unknown()).optional().describe("Additional structured details"),
+      files: z.array(z.string()).optional().describe("List of files affected by this action"),
+    },
+  },
+  k6s_save_context: {
+    description: "Save persistent context that survives session restarts.",
+    inputSchema: {
+      key: z.string().describe("Unique key for this context entry"),
+      value: z.string().describe("Value to save (JSON string)"),
+      agent_name: z.string().optional().describe("Name of the agent saving context"),
+    },
+  },
+  k6s_load_context: {
+    description: "Load previously saved context.",
+    inputSchema: {
+      key: z.string().describe("Key of the context entry to load"),
+    },
+  },
+  k6s_acquire_lock: {
+    description: "Acquire an exclusive lock on a file to prevent conflicts.",
+    inputSchema: {
+      path: z.string().describe("Path to the file to lock"),
+      agent_name: z.string().describe("Name of the agent requesting the lock"),
+      duration_seconds: z.number().optional().describe("Lock duration in seconds (default: 300)"),
+    },
+  },
+  k6s_release_lock: {
+    description: "Release a file lock.",
+    inputSchema: {
+      path: z.string().describe("Path to the file to unlock"),
+      agent_name: z.string().describe("Name of the agent releasing the lock"),
+    },
+  },
+  k6s_get_boundaries: {
+    description: "Get the boundary rules for an agent (allowed/forbidden paths).",
+    inputSchema: {
+      agent_name: z.string().describe("Name of the agent to get boundaries for"),
+    },
+  },
+  k6s_check_path: {
+    description: "Check if an agent is allowed to access a file path.",
+    inputSchema: {
+      path: z.string().describe("Path to check"),
+      agent_name: z.string().describe("Name of the agent"),
+    },
+  },
+  k6s_task_update: {
+    description: "Update task state and progress.",
+    inputSchema: {
+      task_id: z.string().describe("Unique identifier for the task"),
+      status: z.string().describe("Task status (pending, in_progress, completed, failed)"),
+      progress: z.string().optional().describe("Progress description"),
+      agent_name: z.string().optional().describe("Name of the agent updating the task"),
+    },
+  },
+};
+
+interface ToolResult {
+  [key: string]: unknown;
+  content: Array<{ type: "text"; text: string }>;
+}
+
+function textResult(text: string): ToolResult {
+  return { content: [{ type: "text", text }] };
+}
+
+function jsonResult(payload: unknown): ToolResult {
+  return textResult(JSON.stringify(payload));
 }
 
+function errorResult(message: string): ToolResult {
+  return jsonResult({ error: message });
+}
+
+type ToolName = keyof typeof TOOL_DEFINITIONS;
+
+const INPUT_VALIDATORS = Object.fromEntries(
+  Object.entries(TOOL_DEFINITIONS).map(([name, def]) => [
+    name,
+    compileInputValidator(Object.keys(def.inputSchema)),
+  ]),
+) as Record<ToolName, InputValidator>;
+
 export class K6sServer {
   private mcp: McpServer;
   private auditLogger: AuditLogger;
   private stateManager: StateManager;
   private boundaryEnforcer: BoundaryEnforcer;
   private lockManager: FileLockManager;
+  private boundariesJsonCache: string | null = null;
 
   constructor(
     private db: Db,
@@ -128,19 +263,10 @@ export class K6sServer {
     // -- Audit logging.
     this.mcp.registerTool(
       "k6s_log",
-      {
-        description: "Log an action to the audit trail. Call this before and after significant actions.",
-        inputSchema: {
-          action: z.string().describe("Human-readable description of the action"),
-          event_type: z.enum(AGENT_EVENT_TYPES).optional().describe("Type of event (log, file_create, file_modify, file_delete, task_create, task_update, task_complete)"),
-          agent_name: z.string().optional().describe("Name of the agent performing the action"),
-          details: z.record(z.unknown()).optional().describe("Additional structured details"),
-          files: z.array(z.string()).optional().describe("List of files affected by this action"),
-        },
-      },
+      TOOL_DEFINITIONS.k6s_log,
       async (args) => {
-        const err = validateInput(args as Record<string, unknown>);
-        if (err) return { content: [{ type: "text", text: JSON.stringify({ error: err }) }] };
+        const err = INPUT_VALIDATORS.k6s_log(args as Record<string, unknown>);
+        if (err) return errorResult(err);
 
         let agentId: string | null = null;
         if (args.agent_name) {
@@ -150,8 +276,7 @@ export class K6sServer {
 
         // Zod validates the enum at schema level, but belt-and-suspenders:
         // fall back to "log" if something unexpected slips through.
-        const allowedSet: ReadonlySet<string> = new Set(AGENT_EVENT_TYPES);
-        const eventType: EventType = allowedSet.has(args.event_type ?? "")
+        const eventType: EventType = AGENT_EVENT_TYPE_SET.has(args.event_type ?? "")
           ? (args.event_type as EventType)
           : "log";
 
@@ -163,38 +288,22 @@ export class K6sServer {
           filesAffected: args.files,
         });
 
-        const limitWarning = args.agent_name
-          ? this.checkResourceLimit(args.agent_name)
-          : null;
         const result = {
           status: "logged",
           event_id: event.id,
           sequence: event.sequence,
         };
-        const responseText = limitWarning
-          ? `${JSON.stringify(result)}\n\n${limitWarning}`
-          : JSON.stringify(result);
-
-        return {
-          content: [{ type: "text", text: responseText }],
-        };
+        return this.resultWithLimitWarning(result, args.agent_name);
       },
     );
 
     // -- Persistent context.
     this.mcp.registerTool(
       "k6s_save_context",
-      {
-        description: "Save persistent context that survives session restarts.",
-        inputSchema: {
-          key: z.string().describe("Unique key for this context entry"),
-          value: z.string().describe("Value to save (JSON string)"),
-          agent_name: z.string().optional().describe("Name of the agent saving context"),
-        },
-      },
+      TOOL_DEFINITIONS.k6s_save_context,
       async (args) => {
-        const err = validateInput(args as Record<string, unknown>);
-        if (err) return { content: [{ type: "text", text: JSON.stringify({ error: err }) }] };
+        const err = INPUT_VALIDATORS.k6s_save_context(args as Record<string, unknown>);
+        if (err) return errorResult(err);
 
         let agentId: string | null = null;
         if (args.agent_name) {
@@ -216,57 +325,34 @@ export class K6sServer {
           details: { key: args.key },
         });
 
-        const limitWarning = args.agent_name
-          ? this.checkResourceLimit(args.agent_name)
-          : null;
         const result = {
           status: "saved",
           key: args.key,
           updated_at: entry.updatedAt,
         };
-        const responseText = limitWarning
-          ? `${JSON.stringify(result)}\n\n${limitWarning}`
-          : JSON.stringify(result);
-
-        return {
-          content: [{ type: "text", text: responseText }],
-        };
+        return this.resultWithLimitWarning(result, args.agent_name);
       },
     );
 
     this.mcp.registerTool(
       "k6s_load_context",
-      {
-        description: "Load previously saved context.",
-        inputSchema: {
-          key: z.string().describe("Key of the context entry to load"),
-        },
-      },
+      TOOL_DEFINITIONS.k6s_load_context,
       async (args) => {
         const entry = this.stateManager.loadContext(this.sessionId, args.key);
         if (!entry) {
-          return { content: [{ type: "text", text: JSON.stringify({ status: "not_found", key: args.key }) }] };
+          return jsonResult({ status: "not_found", key: args.key });
         }
-        return {
-          content: [{ type: "text", text: JSON.stringify({ status: "found", key: args.key, value: entry.value, updated_at: entry.updatedAt }) }],
-        };
+        return jsonResult({ status: "found", key: args.key, value: entry.value, updated_at: entry.updatedAt });
       },
     );
 
     // -- File locks.
     this.mcp.registerTool(
       "k6s_acquire_lock",
-      {
-        description: "Acquire an exclusive lock on a file to prevent conflicts.",
-        inputSchema: {
-          path: z.string().describe("Path to the file to lock"),
-          agent_name: z.string().describe("Name of the agent requesting the lock"),
-          duration_seconds: z.number().optional().describe("Lock duration in seconds (default: 300)"),
-        },
-      },
+      TOOL_DEFINITIONS.k6s_acquire_lock,
       async (args) => {
-        const err = validateInput(args as Record<string, unknown>);
-        if (err) return { content: [{ type: "text", text: JSON.stringify({ error: err }) }] };
+        const err = INPUT_VALIDATORS.k6s_acquire_lock(args as Record<string, unknown>);
+        if (err) return errorResult(err);
 
         let agent = this.stateManager.getAgentByName(this.sessionId, args.agent_name);
         if (!agent) {
@@ -295,7 +381,7 @@ export class K6sServer {
             enforcementAction: "blocked",
             details: { reason, operation: "lock_acquire" },
           });
-          return { content: [{ type: "text", text: JSON.stringify({ success: false, reason: `Boundary violation: ${reason}` }) }] };
+          return jsonResult({ success: false, reason: `Boundary violation: ${reason}` });
         }
 
         const result = this.lockManager.acquire(args.path, agent.id, args.duration_seconds);
@@ -308,27 +394,16 @@ export class K6sServer {
           });
         }
 
-        const limitWarning = this.checkResourceLimit(args.agent_name);
-        const resultDict = lockResultToDict(result);
-        const responseText = limitWarning
-          ? `${JSON.stringify(resultDict)}\n\n${limitWarning}`
-          : JSON.stringify(resultDict);
-        return { content: [{ type: "text", text: responseText }] };
+        return this.resultWithLimitWarning(lockResultToDict(result), args.agent_name);
       },
     );
 
     this.mcp.registerTool(
       "k6s_release_lock",
-      {
-        description: "Release a file lock.",
-        inputSchema: {
-          path: z.string().describe("Path to the file to unlock"),
-          agent_name: z.string().describe("Name of the agent releasing the lock"),
-        },
-      },
+      TOOL_DEFINITIONS.k6s_release_lock,
       async (args) => {
-        const err = validateInput(args as Record<string, unknown>);
-        if (err) return { content: [{ type: "text", text: JSON.stringify({ error: err }) }] };
+        const err = INPUT_VALIDATORS.k6s_release_lock(args as Record<string, unknown>);
+        if (err) return errorResult(err);
 
         const agent = this.stateManager.getAgentByName(this.sessionId, args.agent_name);
         const agentId = agent?.id ?? "unknown";
@@ -355,7 +430,7 @@ export class K6sServer {
             enforcementAction: "blocked",
             details: { reason, operation: "lock_release" },
           });
-          return { content: [{ type: "text", text: JSON.stringify({ success: false, reason: `Boundary violation: ${reason}` }) }] };
+          return jsonResult({ success: false, reason: `Boundary violation: ${reason}` });
         }
 
         const result = this.lockManager.release(args.path, agentId);
@@ -368,57 +443,38 @@ export class K6sServer {
           });
         }
 
-        return { content: [{ type: "text", text: JSON.stringify(lockResultToDict(result)) }] };
+        return jsonResult(lockResultToDict(result));
       },
     );
 
     // -- Boundaries.
     this.mcp.registerTool(
       "k6s_get_boundaries",
-      {
-        description: "Get the boundary rules for an agent (allowed/forbidden paths).",
-        inputSchema: {
-          agent_name: z.string().describe("Name of the agent to get boundaries for"),
-        },
-      },
+      TOOL_DEFINITIONS.k6s_get_boundaries,
       async (args) => {
         const summary = this.boundaryEnforcer.getAgentBoundariesSummary(args.agent_name);
-        return { content: [{ type: "text", text: JSON.stringify(summary) }] };
+        return jsonResult(summary);
       },
     );
 
     this.mcp.registerTool(
       "k6s_check_path",
-      {
-        description: "Check if an agent is allowed to access a file path.",
-        inputSchema: {
-          path: z.string().describe("Path to check"),
-          agent_name: z.string().describe("Name of the agent"),
-        },
-      },
+      TOOL_DEFINITIONS.k6s_check_path,
       async (args) => {
         const [allowed, reason] = this.boundaryEnforcer.checkPathAllowed(args.path, args.agent_name);
         const result: Record<string, unknown> = { path: args.path, agent: args.agent_name, allowed };
         if (reason) result.reason = reason;
-        return { content: [{ type: "text", text: JSON.stringify(result) }] };
+        return jsonResult(result);
       },
     );
 
     // -- Task tracking.
     this.mcp.registerTool(
       "k6s_task_update",
-      {
-        description: "Update task state and progress.",
-        inputSchema: {
-          task_id: z.string().describe("Unique identifier for the task"),
-          status: z.string().describe("Task status (pending, in_progress, completed, failed)"),
-          progress: z.string().optional().describe("Progress description"),
-          agent_name: z.string().optional().describe("Name of the agent updating the task"),
-        },
-      },
+      TOOL_DEFINITIONS.k6s_task_update,
       async (args) => {
-        const err = validateInput(args as Record<string, unknown>);
-        if (err) return { content: [{ type: "text", text: JSON.stringify({ error: err }) }] };
+        const err = INPUT_VALIDATORS.k6s_task_update(args as Record<string, unknown>);
+        if (err) return errorResult(err);
 
         let agentId: string | null = null;
         if (args.agent_name) {
@@ -433,20 +489,25 @@ export class K6sServer {
           details: { task_id: args.task_id, status: args.status, progress: args.progress ?? "" },
         });
 
-        const limitWarning = args.agent_name
-          ? this.checkResourceLimit(args.agent_name)
-          : null;
         const result = { status: "updated", task_id: args.task_id };
-        const responseText = limitWarning
-          ? `${JSON.stringify(result)}\n\n${limitWarning}`
-          : JSON.stringify(result);
-
-        return { content: [{ type: "text", text: responseText }] };
+        return this.resultWithLimitWarning(result, args.agent_name);
       },
     );
 
   }
 
+  private boundariesJson(): string {
+    this.boundariesJsonCache ??= JSON.stringify(this.config.boundaries);
+    return this.boundariesJsonCache;
+  }
+
+  /** JSON result, followed by a resource-limit warning when one applies. */
+  private resultWithLimitWarning(payload: unknown, agentName?: string): ToolResult {
+    const text = JSON.stringify(payload);
+    const warning = agentName ? this.checkResourceLimit(agentName) : null;
+    return textResult(warning ? `${text}\n\n${warning}` : text);
+  }
+
   private checkResourceLimit(agentName: string): string | null {
     const boundary = this.boundaryEnforcer.getBoundaryForAgent(agentName);
     const limit = boundary?.max_tool_calls_per_session;
@@ -483,12 +544,11 @@ export class K6sServer {
       "k6s://audit/recent",
       { description: "Last 50 audit events", mimeType: "application/json" },
       async () => {
-        const events = this.auditLogger.getEvents({ limit: 50 });
         return {
           contents: [{
             uri: "k6s://audit/recent",
             mimeType: "application/json",
-            text: JSON.stringify(events),
+            text: this.auditLogger.getEventsJson(50),
           }],
         };
       },
@@ -503,7 +563,7 @@ export class K6sServer {
           contents: [{
             uri: "k6s://boundaries/all",
             mimeType: "application/json",
-            text: JSON.stringify(this.config.boundaries),
+            text: this.boundariesJson(),
           }],
         };
       },
@@ -3,8 +3,9 @@
  */
 
 import { z } from "zod";
-import { ulid } from "ulid";
 import type { Row } from "../store/db.js";
+import { newId } from "./ids.js";
+import { nowIso } from "./time.js";
 
 export const AgentRole = z.enum(["lead", "teammate"]);
 export type AgentRole = z.infer<typeof AgentRole>;
@@ -13,13 +14,13 @@ export const AgentState = z.enum(["active", "idle", "completed", "failed"]);
 export type AgentState = z.infer<typeof AgentState>;
 
 export const AgentSchema = z.object({
-  id: z.string().default(() => ulid()),
+  id: z.string().default(() => newId()),
   sessionId: z.string(),
   name: z.string(),
   role: AgentRole.default("teammate"),
   specialization: z.string().nullable().default(null),
   state: AgentState.default("active"),
-  spawnedAt: z.string().default(() => new Date().toISOString()),
+  spawnedAt: z.string().default(() => nowIso()),
   boundaryConfig: z.string().nullable().default(null),
   metadata: z.string().nullable().default(null),
   claudeSessionId: z.string().nullable().default(null),
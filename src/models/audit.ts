@@ -3,8 +3,9 @@
  */
 
 import { z } from "zod";
-import { ulid } from "ulid";
 import type { Row } from "../store/db.js";
+import { newId } from "./ids.js";
+import { nowIso } from "./time.js";
 
 export const EventType = z.enum([
   // File operations
@@ -53,8 +54,8 @@ export const AuditSeverity = z.enum(["info", "warning", "critical"]);
 export type AuditSeverity = z.infer<typeof AuditSeverity>;
 
 export const AuditEventSchema = z.object({
-  id: z.string().default(() => ulid()),
-  timestamp: z.string().default(() => new Date().toISOString()),
+  id: z.string().default(() => newId()),
+  timestamp: z.string().default(() => nowIso()),
   sequence: z.number().default(0),
   sessionId: z.string(),
   agentId: z.string().nullable().default(null),
@@ -68,6 +69,12 @@ export const AuditEventSchema = z.object({
 });
 export type AuditEvent = z.infer<typeof AuditEventSchema>;
 
+/** Column order of rows produced by auditEventToDbRow. */
+export const AUDIT_EVENT_COLUMNS: readonly string[] = Object.freeze([
+  "id", "sequence", "session_id", "agent_id", "timestamp", "event_type",
+  "action", "details", "files_affected", "gate_id", "hmac", "severity",
+]);
+
 export function auditEventToDbRow(e: AuditEvent): Row {
   return {
     id: e.id,
@@ -102,8 +109,23 @@ export function auditEventFromDbRow(row: Row): AuditEvent {
   };
 }
 
+function pad2(n: number): string {
+  return n < 10 ? `0${n}` : String(n);
+}
+
+/**
+ * Local wall-clock "HH:MM:SS" for an event timestamp. Same output as
+ * `new Date(ts).toTimeString().slice(0, 8)` without formatting the
+ * timezone name for every row.
+ */
+export function localTimeOfDay(timestamp: string): string {
+  const d = new Date(timestamp);
+  if (Number.isNaN(d.getTime())) return "--:--:--";
+  return `${pad2(d.getHours())}:${pad2(d.getMinutes())}:${pad2(d.getSeconds())}`;
+}
+
 export function shortSummary(e: AuditEvent): string {
   const agent = e.agentId ? `[${e.agentId}]` : "[system]";
-  const time = new Date(e.timestamp).toTimeString().slice(0, 8);
+  const time = localTimeOfDay(e.timestamp);
   return `${time} ${agent} ${e.eventType}: ${e.action}`;
 }
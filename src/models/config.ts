@@ -2,9 +2,10 @@
  * Configuration models for k6s.yaml parsing and validation.
  */
 
-import { readFileSync, writeFileSync } from "node:fs";
+import { readFileSync, statSync, writeFileSync } from "node:fs";
+import path from "node:path";
 import { z } from "zod";
-import YAML from "yaml";
+import YAML, { type ToStringOptions } from "yaml";
 
 export const ProjectConfigSchema = z.object({
   name: z.string(),
@@ -170,10 +171,28 @@ export const K6sConfigSchema = z.object({
 export type K6sConfig = z.infer<typeof K6sConfigSchema>;
 export type GateConfig = z.infer<typeof GateConfigSchema>;
 
+// Default configs are validated once; callers get a deep copy with the
+// project name filled in.
+let defaultConfigTemplate: K6sConfig | null = null;
+let bareConfigTemplate: K6sConfig | null = null;
+
+// Parsed configs keyed by resolved path. A hook invocation loads k6s.yaml
+// several times; when the file is unchanged (same mtime, size and inode)
+// the YAML parse and schema validation are skipped.
+const loadedConfigs = new Map<string, { stamp: string; config: K6sConfig }>();
+
 export function loadConfig(filePath: string): K6sConfig {
-  const raw = readFileSync(filePath, "utf-8");
+  const resolved = path.resolve(filePath);
+  const st = statSync(resolved, { bigint: true });
+  const stamp = `${st.mtimeNs}:${st.size}:${st.ino}`;
+  const cached = loadedConfigs.get(resolved);
+  if (cached?.stamp === stamp) return structuredClone(cached.config);
+
+  const raw = readFileSync(resolved, "utf-8");
   const data = YAML.parse(raw);
-  return K6sConfigSchema.parse(data);
+  const config = K6sConfigSchema.parse(data);
+  loadedConfigs.set(resolved, { stamp, config });
+  return structuredClone(config);
 }
 
 export function loadConfigOrDefault(
@@ -183,13 +202,23 @@ export function loadConfigOrDefault(
   try {
     return loadConfig(filePath);
   } catch {
-    return K6sConfigSchema.parse({ project: { name: projectName } });
+    bareConfigTemplate ??= K6sConfigSchema.parse({ project: { name: "" } });
+    const config = structuredClone(bareConfigTemplate);
+    config.project.name = projectName;
+    return config;
   }
 }
 
+// Shared stringify options so every k6s.yaml writer emits the same layout.
+const CONFIG_YAML_OPTIONS: ToStringOptions = { sortMapEntries: false };
+
+/** Serialize a config (or config snapshot) to k6s.yaml text, keeping key order. */
+export function configToYaml(config: unknown): string {
+  return YAML.stringify(config, CONFIG_YAML_OPTIONS);
+}
+
 export function saveConfig(config: K6sConfig, filePath: string): void {
-  const yaml = YAML.stringify(config, { sortMapEntries: false });
-  writeFileSync(filePath, yaml);
+  writeFileSync(filePath, configToYaml(config));
 }
 
 /**
@@ -271,9 +300,16 @@ export function sanitizeConfigForStorage(config: K6sConfig): K6sConfig {
 }
 
 export function generateDefaultConfig(projectName: string): K6sConfig {
+  defaultConfigTemplate ??= buildDefaultConfig();
+  const config = structuredClone(defaultConfigTemplate);
+  config.project.name = projectName;
+  return config;
+}
+
+function buildDefaultConfig(): K6sConfig {
   return K6sConfigSchema.parse({
     version: "1",
-    project: { name: projectName, description: "Project governed by Khoregos" },
+    project: { name: "", description: "Project governed by Khoregos" },
     boundaries: [
       {
         pattern: "*",
@@ -4,6 +4,7 @@
 
 import { z } from "zod";
 import type { Row } from "../store/db.js";
+import { nowIso } from "./time.js";
 
 // Context entry
 
@@ -12,7 +13,7 @@ export const ContextEntrySchema = z.object({
   sessionId: z.string(),
   agentId: z.string().nullable().default(null),
   value: z.string(),
-  updatedAt: z.string().default(() => new Date().toISOString()),
+  updatedAt: z.string().default(() => nowIso()),
 });
 export type ContextEntry = z.infer<typeof ContextEntrySchema>;
 
@@ -42,7 +43,7 @@ export const FileLockSchema = z.object({
   path: z.string(),
   sessionId: z.string(),
   agentId: z.string(),
-  acquiredAt: z.string().default(() => new Date().toISOString()),
+  acquiredAt: z.string().default(() => nowIso()),
   expiresAt: z.string().nullable().default(null),
 });
 export type FileLock = z.infer<typeof FileLockSchema>;
@@ -69,7 +70,7 @@ export function fileLockFromDbRow(row: Row): FileLock {
 
 export function isLockExpired(l: FileLock): boolean {
   if (!l.expiresAt) return false;
-  return new Date() > new Date(l.expiresAt);
+  return Date.now() > Date.parse(l.expiresAt);
 }
 
 // Boundary violation
@@ -78,7 +79,7 @@ export const BoundaryViolationSchema = z.object({
   id: z.string(),
   sessionId: z.string(),
   agentId: z.string().nullable().default(null),
-  timestamp: z.string().default(() => new Date().toISOString()),
+  timestamp: z.string().default(() => nowIso()),
   filePath: z.string(),
   violationType: z.string(),
   enforcementAction: z.string(),
@@ -86,6 +87,12 @@ export const BoundaryViolationSchema = z.object({
 });
 export type BoundaryViolation = z.infer<typeof BoundaryViolationSchema>;
 
+/** Column order of rows produced by boundaryViolationToDbRow. */
+export const BOUNDARY_VIOLATION_COLUMNS: readonly string[] = Object.freeze([
+  "id", "session_id", "agent_id", "timestamp", "file_path",
+  "violation_type", "enforcement_action", "details",
+]);
+
 export function boundaryViolationToDbRow(v: BoundaryViolation): Row {
   return {
     id: v.id,
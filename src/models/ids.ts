@@ -0,0 +1,12 @@
+/**
+ * Shared ULID generator for high-volume records (agents, audit events).
+ */
+
+import { monotonicFactory } from "ulid";
+
+/**
+ * Monotonic ULID factory. Within the same millisecond it increments the
+ * previous random component instead of drawing 80 fresh random bits, which
+ * is cheaper in event bursts and keeps ids in creation order.
+ */
+export const newId: () => string = monotonicFactory();
@@ -0,0 +1,12 @@
+/**
+ * Shared path normalization for glob matching and stored file paths.
+ */
+
+import path from "node:path";
+
+/**
+ * Convert native separators to "/". Chosen once at load time: the
+ * identity function where path.sep is already "/".
+ */
+export const toPosixPath: (p: string) => string =
+  path.sep === "/" ? (p) => p : (p) => p.split(path.sep).join("/");
@@ -5,6 +5,7 @@
 import { z } from "zod";
 import { ulid } from "ulid";
 import type { Row } from "../store/db.js";
+import { nowIso } from "./time.js";
 
 export const SessionState = z.enum([
   "created",
@@ -19,7 +20,7 @@ export const SessionSchema = z.object({
   id: z.string().default(() => ulid()),
   objective: z.string(),
   state: SessionState.default("created"),
-  startedAt: z.string().default(() => new Date().toISOString()),
+  startedAt: z.string().default(() => nowIso()),
   endedAt: z.string().nullable().default(null),
   parentSessionId: z.string().nullable().default(null),
   configSnapshot: z.string().nullable().default(null),
@@ -87,7 +88,5 @@ export function isSessionActive(s: Session): boolean {
 
 export function sessionDurationSeconds(s: Session): number | null {
   if (!s.endedAt) return null;
-  return (
-    (new Date(s.endedAt).getTime() - new Date(s.startedAt).getTime()) / 1000
-  );
+  return (Date.parse(s.endedAt) - Date.parse(s.startedAt)) / 1000;
 }
@@ -0,0 +1,23 @@
+/**
+ * Shared timestamp formatting for records written to the database.
+ */
+
+// Cached "YYYY-MM-DDTHH:MM:SS." prefix for the most recent wall-clock second.
+// Bursts of records within one second only format the millisecond suffix.
+let cachedSecond = -1;
+let cachedPrefix = "";
+
+/** Format epoch milliseconds exactly like `Date#toISOString`. */
+export function formatIsoTimestamp(ms: number): string {
+  const second = Math.floor(ms / 1000);
+  if (second !== cachedSecond) {
+    cachedSecond = second;
+    cachedPrefix = new Date(second * 1000).toISOString().slice(0, 20);
+  }
+  return `${cachedPrefix}${String(ms - second * 1000).padStart(3, "0")}Z`;
+}
+
+/** Current time as an ISO-8601 string, without allocating a Date. */
+export function nowIso(): string {
+  return formatIsoTimestamp(Date.now());
+}
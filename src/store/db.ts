@@ -2,7 +2,7 @@
  * SQLite database connection and management.
  */
 
-import { chmodSync, mkdirSync } from "node:fs";
+import { chmodSync, mkdirSync, statSync } from "node:fs";
 import path from "node:path";
 import Database from "better-sqlite3";
 import { SCHEMA_VERSION, getMigrations } from "./migrations.js";
@@ -67,9 +67,36 @@ const TABLE_SCHEMA: Record<string, ReadonlySet<string>> = {
 /** Only allow simple alphanumeric + underscore identifiers. */
 const SAFE_IDENTIFIER = /^[a-z][a-z0-9_]*$/i;
 
+/**
+ * Restrict permissions on a path, skipping the chmod when the mode is
+ * already correct. A stat is a cheap read; chmod rewrites inode metadata
+ * on every connect. Existing installs with looser modes are still fixed.
+ */
+function ensureMode(target: string, mode: number): void {
+  if ((statSync(target).mode & 0o777) !== mode) {
+    chmodSync(target, mode);
+  }
+}
+
+// Statements behind fetchOne/fetchAll/fetchAllAs are cached by SQL text.
+// Callers pass constant SQL, but the cache is cleared when full in case
+// one interpolates values. Writes go through the write-statement cache.
+const READ_STATEMENT_CACHE_MAX = 128;
+
+function insertSql(verb: string, table: string, keys: readonly string[]): string {
+  const placeholders = keys.map(() => "?").join(", ");
+  return `${verb} INTO ${table} (${keys.join(", ")}) VALUES (${placeholders})`;
+}
+
 export class Db {
   readonly path: string;
   private _db: Database.Database | null = null;
+  private statements = new Map<string, Database.Statement>();
+  private readStatements = new Map<string, Database.Statement>();
+  private columnInserts = new Map<
+    readonly string[],
+    { table: string; stmt: Database.Statement }
+  >();
 
   constructor(dbPath: string) {
     this.path = dbPath;
@@ -85,7 +112,7 @@ export class Db {
     }
   }
 
-  private assertValidColumns(table: string, columns: string[]): void {
+  private assertValidColumns(table: string, columns: readonly string[]): void {
     const schema = TABLE_SCHEMA[table];
     if (!schema) {
       throw new Error(`Db: unknown table "${table}"`);
@@ -105,7 +132,7 @@ export class Db {
 
     const dir = path.dirname(this.path);
     mkdirSync(dir, { recursive: true });
-    chmodSync(dir, 0o700);
+    ensureMode(dir, 0o700);
 
     try {
       this._db = new Database(this.path);
@@ -128,18 +155,26 @@ export class Db {
       }
       throw err;
     }
-    chmodSync(this.path, 0o600);
+    ensureMode(this.path, 0o600);
 
     this._db.pragma("journal_mode = WAL");
     this._db.pragma("busy_timeout = 5000");
     this._db.pragma("synchronous = FULL");
     this._db.pragma("foreign_keys = ON");
+    this._db.pragma("temp_store = MEMORY");
+    // Upper bound on the page cache (negative = KiB), not an allocation:
+    // short-lived hook processes never approach it, while the dashboard
+    // and MCP server keep hot audit pages resident.
+    this._db.pragma("cache_size = -64000");
 
     this.runMigrations();
   }
 
   close(): void {
     if (this._db) {
+      this.statements.clear();
+      this.readStatements.clear();
+      this.columnInserts.clear();
       this._db.close();
       this._db = null;
     }
@@ -155,6 +190,13 @@ export class Db {
   }
 
   private runMigrations(): void {
+    // PRAGMA user_version mirrors the highest applied migration, so a
+    // current database is recognised from the header without parsing DDL
+    // or querying schema_migrations.
+    if ((this.db.pragma("user_version", { simple: true }) as number) >= SCHEMA_VERSION) {
+      return;
+    }
+
     this.db.exec(`
       CREATE TABLE IF NOT EXISTS schema_migrations (
         version INTEGER PRIMARY KEY,
@@ -162,19 +204,29 @@ export class Db {
       )
     `);
 
+    // Apply every pending migration under one write lock: the batch
+    // commits (and syncs) once, and a process racing on first connect
+    // waits here instead of re-running the same DDL.
+    this.transactionImmediate(() => {
+      const currentVersion = this.appliedSchemaVersion();
+      const recordVersion = this.db.prepare(
+        "INSERT INTO schema_migrations (version) VALUES (?)",
+      );
+      for (const [version, sql] of getMigrations()) {
+        if (version > currentVersion) {
+          this.db.exec(sql);
+          recordVersion.run(version);
+        }
+      }
+      this.db.pragma(`user_version = ${Math.max(currentVersion, SCHEMA_VERSION)}`);
+    });
+  }
+
+  private appliedSchemaVersion(): number {
     const row = this.db
       .prepare("SELECT MAX(version) as max_version FROM schema_migrations")
       .get() as { max_version: number | null } | undefined;
-    const currentVersion = row?.max_version ?? 0;
-
-    for (const [version, sql] of getMigrations()) {
-      if (version > currentVersion) {
-        this.db.exec(sql);
-        this.db
-          .prepare("INSERT INTO schema_migrations (version) VALUES (?)")
-          .run(version);
-      }
-    }
+    return row?.max_version ?? 0;
   }
 
   transaction<T>(fn: () => T): T {
@@ -183,51 +235,88 @@ export class Db {
 
   /**
    * Run a function inside a BEGIN IMMEDIATE transaction.
-   * This acquires a write lock before running the callback,
-   * preventing concurrent processes from reading stale data.
+   * This acquires the write lock before running the callback, so
+   * concurrent processes queue on busy_timeout instead of failing when a
+   * deferred read transaction is upgraded to a write. Nested calls run
+   * as savepoints inside the outer transaction.
    */
   transactionImmediate<T>(fn: () => T): T {
-    const stmt = "BEGIN IMMEDIATE";
-    this.db.prepare(stmt).run();
-    try {
-      const result = fn();
-      this.db.prepare("COMMIT").run();
-      return result;
-    } catch (err) {
-      this.db.prepare("ROLLBACK").run();
-      throw err;
-    }
+    return this.db.transaction(fn).immediate();
   }
 
   fetchOne(sql: string, params: unknown[] = []): Row | undefined {
-    return this.db.prepare(sql).get(...params) as Row | undefined;
+    return this.readStatement(sql).get(...params) as Row | undefined;
   }
 
   fetchAll(sql: string, params: unknown[] = []): Row[] {
-    return this.db.prepare(sql).all(...params) as Row[];
+    return this.readStatement(sql).all(...params) as Row[];
+  }
+
+  /**
+   * Fetch all rows and convert each with `map` in a single pass, reusing
+   * the array returned by better-sqlite3 instead of allocating a second
+   * one via `fetchAll(...).map(...)`.
+   */
+  fetchAllAs<T>(sql: string, params: unknown[], map: (row: Row) => T): T[] {
+    const rows = this.readStatement(sql).all(...params) as unknown[];
+    for (let i = 0; i < rows.length; i++) {
+      rows[i] = map(rows[i] as Row);
+    }
+    return rows as T[];
   }
 
   insert(table: string, data: Row): number | bigint {
-    this.assertValidTable(table);
     const keys = Object.keys(data);
-    this.assertValidColumns(table, keys);
+    const stmt = this.writeStatement("insert", table, keys, "", () =>
+      insertSql("INSERT", table, keys),
+    );
+    return stmt.run(...Object.values(data)).lastInsertRowid;
+  }
 
-    const columns = keys.join(", ");
-    const placeholders = keys.map(() => "?").join(", ");
-    const sql = `INSERT INTO ${table} (${columns}) VALUES (${placeholders})`;
-    const result = this.db.prepare(sql).run(...Object.values(data));
-    return result.lastInsertRowid;
+  /**
+   * Insert a row whose shape is fixed by a module-level column list. The
+   * statement is cached by the identity of `columns`, so each call is one
+   * map lookup plus reading the values in column order.
+   */
+  insertColumns(table: string, columns: readonly string[], row: Row): number | bigint {
+    let cached = this.columnInserts.get(columns);
+    if (cached?.table !== table) {
+      this.assertValidTable(table);
+      this.assertValidColumns(table, columns);
+      cached = { table, stmt: this.db.prepare(insertSql("INSERT", table, columns)) };
+      this.columnInserts.set(columns, cached);
+    }
+    const values: unknown[] = new Array(columns.length);
+    for (let i = 0; i < columns.length; i++) values[i] = row[columns[i]];
+    return cached.stmt.run(values).lastInsertRowid;
+  }
+
+  /**
+   * Insert many rows that share the same column set in one IMMEDIATE
+   * transaction with a single prepared statement. Autocommitted inserts
+   * pay a full journal sync per row under synchronous=FULL; this pays it
+   * once per batch.
+   */
+  insertMany(table: string, rows: Row[]): number {
+    if (rows.length === 0) return 0;
+    const keys = Object.keys(rows[0]);
+    const stmt = this.writeStatement("insert", table, keys, "", () =>
+      insertSql("INSERT", table, keys),
+    );
+    return this.transactionImmediate(() => {
+      for (const row of rows) {
+        stmt.run(...keys.map((k) => row[k]));
+      }
+      return rows.length;
+    });
   }
 
   insertOrReplace(table: string, data: Row): void {
-    this.assertValidTable(table);
     const keys = Object.keys(data);
-    this.assertValidColumns(table, keys);
-
-    const columns = keys.join(", ");
-    const placeholders = keys.map(() => "?").join(", ");
-    const sql = `INSERT OR REPLACE INTO ${table} (${columns}) VALUES (${placeholders})`;
-    this.db.prepare(sql).run(...Object.values(data));
+    const stmt = this.writeStatement("replace", table, keys, "", () =>
+      insertSql("INSERT OR REPLACE", table, keys),
+    );
+    stmt.run(...Object.values(data));
   }
 
   update(
@@ -236,23 +325,69 @@ export class Db {
     where: string,
     whereParams: unknown[],
   ): number {
-    this.assertValidTable(table);
     const keys = Object.keys(data);
-    this.assertValidColumns(table, keys);
-
-    const setClause = keys.map((k) => `${k} = ?`).join(", ");
-    const sql = `UPDATE ${table} SET ${setClause} WHERE ${where}`;
-    const result = this.db
-      .prepare(sql)
-      .run(...Object.values(data), ...whereParams);
-    return result.changes;
+    const stmt = this.writeStatement("update", table, keys, where, () => {
+      const setClause = keys.map((k) => `${k} = ?`).join(", ");
+      return `UPDATE ${table} SET ${setClause} WHERE ${where}`;
+    });
+    return stmt.run(...Object.values(data), ...whereParams).changes;
+  }
+
+  /**
+   * Run an UPDATE ... RETURNING statement and return the first returned
+   * row. The statement is kept in the write-statement cache under its SQL
+   * text; callers pass constant SQL, as with the other write helpers.
+   */
+  updateReturning(sql: string, params: unknown[] = []): Row | undefined {
+    const cacheKey = `returning\0${sql}`;
+    let stmt = this.statements.get(cacheKey);
+    if (!stmt) {
+      stmt = this.db.prepare(sql);
+      this.statements.set(cacheKey, stmt);
+    }
+    return stmt.get(...params) as Row | undefined;
   }
 
   delete(table: string, where: string, whereParams: unknown[]): number {
-    this.assertValidTable(table);
-    const sql = `DELETE FROM ${table} WHERE ${where}`;
-    const result = this.db.prepare(sql).run(...whereParams);
-    return result.changes;
+    const stmt = this.writeStatement("delete", table, [], where, () =>
+      `DELETE FROM ${table} WHERE ${where}`,
+    );
+    return stmt.run(...whereParams).changes;
+  }
+
+  private readStatement(sql: string): Database.Statement {
+    let stmt = this.readStatements.get(sql);
+    if (!stmt) {
+      stmt = this.db.prepare(sql);
+      if (this.readStatements.size >= READ_STATEMENT_CACHE_MAX) this.readStatements.clear();
+      this.readStatements.set(sql, stmt);
+    }
+    return stmt;
+  }
+
+  /**
+   * Prepared statement for a generated write, keyed by operation, table,
+   * column list and WHERE clause. better-sqlite3 recompiles SQL on every
+   * prepare(), so each distinct shape is validated and compiled once per
+   * connection. Callers pass constant WHERE clauses, which keeps the
+   * cache bounded by the number of call sites.
+   */
+  private writeStatement(
+    op: string,
+    table: string,
+    keys: string[],
+    where: string,
+    buildSql: () => string,
+  ): Database.Statement {
+    const cacheKey = `${op}\0${table}\0${keys.join(",")}\0${where}`;
+    let stmt = this.statements.get(cacheKey);
+    if (!stmt) {
+      this.assertValidTable(table);
+      this.assertValidColumns(table, keys);
+      stmt = this.db.prepare(buildSql());
+      this.statements.set(cacheKey, stmt);
+    }
+    return stmt;
   }
 
   get schemaVersion(): number {
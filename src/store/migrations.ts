@@ -2,7 +2,7 @@
  * Database schema migrations for Khoregos.
  */
 
-export const SCHEMA_VERSION = 8;
+export const SCHEMA_VERSION = 9;
 
 type Migration = [version: number, sql: string];
 
@@ -219,6 +219,15 @@ const MIGRATIONS: Migration[] = [
       ON audit_events(session_id, sequence);
     `,
   ],
+  [
+    9,
+    `
+    -- Session lookups filter by state and order by start time (active,
+    -- resumable, latest, list); without these they scan the whole table.
+    CREATE INDEX IF NOT EXISTS idx_sessions_state_started ON sessions(state, started_at);
+    CREATE INDEX IF NOT EXISTS idx_sessions_started ON sessions(started_at);
+    `,
+  ],
 ];
 
 export function getMigrations(): Migration[] {
@@ -12,8 +12,9 @@ import type { AuditLogger } from "../engine/audit.js";
 import type { BoundaryEnforcer } from "../engine/boundaries.js";
 import type { EventBus } from "../engine/events.js";
 import type { GateConfig } from "../models/config.js";
+import { toPosixPath } from "../models/paths.js";
 
-const IGNORED_DIRS = [
+const IGNORED_DIRS: ReadonlySet<string> = new Set([
   ".git",
   ".khoregos",
   "__pycache__",
@@ -22,32 +23,82 @@ const IGNORED_DIRS = [
   "venv",
   "dist",
   ".next",
-];
+]);
+
+// Repeated events for the same path within this window (editor save
+// sequences, touch, chmod) are logged once.
+const EVENT_COALESCE_MS = 20;
+// Bound on the coalescing buffer; a burst larger than this (checkout,
+// npm install) is flushed immediately rather than held in memory.
+const MAX_PENDING_EVENTS = 2048;
+
+type FileEventType = "file_create" | "file_modify" | "file_delete";
+
+// chokidar event name -> audit event type; directory events are not mapped.
+const FILE_EVENT_TYPES: ReadonlyMap<string, FileEventType> = new Map([
+  ["add", "file_create"],
+  ["change", "file_modify"],
+  ["unlink", "file_delete"],
+]);
+
+// Patterns with none of these characters can only match themselves.
+const GLOB_SYNTAX = /[*?[\]{}()!+@\\]/;
+
+function isLiteralPattern(pattern: string): boolean {
+  return !GLOB_SYNTAX.test(pattern) && !pattern.startsWith("./");
+}
+
+/**
+ * Compile a rule's glob patterns into a single regex alternation, so a
+ * path is tested once per rule instead of once per pattern.
+ */
+function compileGlobUnion(globs: string[]): picomatch.Matcher {
+  if (globs.length === 1) return picomatch(globs[0]);
+  const union = new RegExp(
+    globs.map((g) => `(?:${picomatch.makeRe(g).source})`).join("|"),
+  );
+  return (filePath: string) => union.test(filePath);
+}
+
+interface CompiledRule {
+  literals: ReadonlySet<string>;
+  matches: picomatch.Matcher | null;
+}
 
 export class ReviewPatternMatcher {
-  private matchers: Map<string, picomatch.Matcher[]> = new Map();
+  // Literal patterns (package.json, go.mod, ...) are checked with a Set
+  // lookup; the rest of a rule's patterns share one compiled matcher.
+  private rules: Map<string, CompiledRule> = new Map();
+  private rulesById: Map<string, GateConfig> = new Map();
 
   constructor(rules: GateConfig[]) {
     for (const rule of rules) {
+      // First definition wins, matching a linear find() over the list.
+      if (!this.rulesById.has(rule.id)) this.rulesById.set(rule.id, rule);
       const patterns = rule.trigger.file_patterns ?? [];
       if (patterns.length > 0) {
-        this.matchers.set(
-          rule.id,
-          patterns.map((p: string) => picomatch(p)),
-        );
+        const globs = patterns.filter((p) => !isLiteralPattern(p));
+        this.rules.set(rule.id, {
+          literals: new Set(patterns.filter(isLiteralPattern)),
+          matches: globs.length > 0 ? compileGlobUnion(globs) : null,
+        });
       }
     }
   }
 
   matchingRules(filePath: string): string[] {
     const matched: string[] = [];
-    for (const [ruleId, matchers] of this.matchers) {
-      if (matchers.some((m) => m(filePath))) {
+    for (const [ruleId, rule] of this.rules) {
+      if (rule.literals.has(filePath) || (rule.matches !== null && rule.matches(filePath))) {
         matched.push(ruleId);
       }
     }
     return matched;
   }
+
+  getRule(ruleId: string): GateConfig | undefined {
+    return this.rulesById.get(ruleId);
+  }
 }
 
 /** @deprecated Use ReviewPatternMatcher instead. */
@@ -65,14 +116,23 @@ export interface FilesystemWatcherOptions {
 export class FilesystemWatcher {
   private watcher: FSWatcher | null = null;
   private projectRoot: string;
+  private rootPrefix: string;
   private sessionId: string;
   private auditLogger: AuditLogger;
   private boundaryEnforcer?: BoundaryEnforcer;
   private eventBus?: EventBus;
   private patternMatcher: ReviewPatternMatcher;
+  private pendingEvents: Array<[eventPath: string, eventType: FileEventType]> = [];
+  private lastPendingType = new Map<string, FileEventType>();
+  private flushTimer: ReturnType<typeof setTimeout> | null = null;
 
   constructor(opts: FilesystemWatcherOptions) {
-    this.projectRoot = opts.projectRoot;
+    // Resolved once, so chokidar reports absolute paths that always share
+    // rootPrefix and relativePath() never needs its fallback.
+    this.projectRoot = path.resolve(opts.projectRoot);
+    this.rootPrefix = this.projectRoot.endsWith(path.sep)
+      ? this.projectRoot
+      : this.projectRoot + path.sep;
     this.sessionId = opts.sessionId;
     this.auditLogger = opts.auditLogger;
     this.boundaryEnforcer = opts.boundaryEnforcer;
@@ -83,16 +143,29 @@ export class FilesystemWatcher {
   start(): void {
     if (this.watcher) return;
 
+    // chokidar hands matchers forward-slash paths under the root; the
+    // first segment after the root decides, with one Set lookup.
+    const rootPrefix = toPosixPath(this.rootPrefix);
+    const ignored = (p: string): boolean => {
+      if (!p.startsWith(rootPrefix)) return false;
+      const slash = p.indexOf("/", rootPrefix.length);
+      return IGNORED_DIRS.has(
+        slash === -1 ? p.slice(rootPrefix.length) : p.slice(rootPrefix.length, slash),
+      );
+    };
+
     this.watcher = watch(this.projectRoot, {
-      ignored: IGNORED_DIRS.map((d) => path.join(this.projectRoot, d)),
+      ignored,
       persistent: true,
       ignoreInitial: true,
       awaitWriteFinish: { stabilityThreshold: 200, pollInterval: 50 },
     });
 
-    this.watcher.on("add", (fp) => this.handleEvent(fp, "file_create"));
-    this.watcher.on("change", (fp) => this.handleEvent(fp, "file_modify"));
-    this.watcher.on("unlink", (fp) => this.handleEvent(fp, "file_delete"));
+    // A single listener with a table lookup instead of one per event name.
+    this.watcher.on("all", (eventName: string, fp: string) => {
+      const eventType = FILE_EVENT_TYPES.get(eventName);
+      if (eventType) this.queueEvent(fp, eventType);
+    });
   }
 
   stop(): void {
@@ -100,13 +173,61 @@ export class FilesystemWatcher {
       this.watcher.close();
       this.watcher = null;
     }
+    this.flushEvents();
+  }
+
+  /**
+   * Buffer an event for the coalescing window. An event is dropped only
+   * when it repeats the latest pending event for the same path, so the
+   * logged sequence keeps every change of type in arrival order.
+   */
+  private queueEvent(eventPath: string, eventType: FileEventType): void {
+    if (this.lastPendingType.get(eventPath) !== eventType) {
+      this.lastPendingType.set(eventPath, eventType);
+      this.pendingEvents.push([eventPath, eventType]);
+      if (this.pendingEvents.length >= MAX_PENDING_EVENTS) {
+        this.flushEvents();
+        return;
+      }
+    }
+    this.flushTimer ??= setTimeout(() => this.flushEvents(), EVENT_COALESCE_MS);
+  }
+
+  private flushEvents(): void {
+    if (this.flushTimer) {
+      clearTimeout(this.flushTimer);
+      this.flushTimer = null;
+    }
+    const pending = this.pendingEvents;
+    this.pendingEvents = [];
+    this.lastPendingType.clear();
+    // Each event is logged on its own: a failure (e.g. SQLITE_BUSY) must
+    // not drop the rest of the batch, and a timer callback has no caller
+    // to report to.
+    for (const [eventPath, eventType] of pending) {
+      try {
+        this.handleEvent(eventPath, eventType);
+      } catch (err: unknown) {
+        const message = err instanceof Error ? err.message : String(err);
+        console.error(`Failed to record ${eventType} for ${eventPath}: ${message}.`);
+      }
+    }
+  }
+
+  /**
+   * Project-relative, forward-slash path for an event. chokidar reports
+   * paths joined onto the watched root, so slicing off the root prefix is
+   * enough; anything else falls back to path.relative.
+   */
+  private relativePath(eventPath: string): string {
+    if (eventPath.startsWith(this.rootPrefix)) {
+      return toPosixPath(eventPath.slice(this.rootPrefix.length));
+    }
+    return toPosixPath(path.relative(this.projectRoot, eventPath));
   }
 
-  private handleEvent(
-    absolutePath: string,
-    eventType: "file_create" | "file_modify" | "file_delete",
-  ): void {
-    const relativePath = path.relative(this.projectRoot, absolutePath);
+  private handleEvent(absolutePath: string, eventType: FileEventType): void {
+    const relativePath = this.relativePath(absolutePath);
 
     const event = this.auditLogger.log({
       eventType,
@@ -275,6 +275,20 @@ describe("AuditLogger", () => {
       expect(row.count).toBe(0);
     });
 
+    it("start() tolerates a malformed config snapshot", () => {
+      const sid = "01ARZ3NDEKTSV4RRFFQ69G5FB2";
+      db.insert("sessions", {
+        id: sid,
+        objective: "bad snapshot",
+        state: "active",
+        started_at: new Date().toISOString(),
+        config_snapshot: "{not json",
+      });
+      const logger = new AuditLogger(db, sid, null, signingKey!);
+      expect(() => logger.start()).not.toThrow();
+      expect(logger.log({ eventType: "log", action: "ok" }).sequence).toBe(1);
+    });
+
     it("dispatches webhook side effects after persisting an audit event", () => {
       const dispatcher = new WebhookDispatcher([]);
       const dispatchSpy = vi
@@ -348,6 +362,15 @@ describe("AuditLogger", () => {
       const events = logger.getEvents({ eventType: "session_start", limit: 5 });
       events.forEach((e) => expect(e.eventType).toBe("session_start"));
     });
+
+    it("getEventsJson matches JSON.stringify(getEvents) across repeated reads", () => {
+      const logger = new AuditLogger(db, sessionId, null, null);
+      const first = logger.getEventsJson(5);
+      logger.log({ eventType: "log", action: "after first read" });
+      const second = logger.getEventsJson(5);
+      expect(second).toBe(JSON.stringify(logger.getEvents({ limit: 5 })));
+      expect(second).not.toBe(first);
+    });
   });
 });
 
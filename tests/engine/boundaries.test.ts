@@ -58,6 +58,17 @@ describe("BoundaryEnforcer", () => {
       const b = enforcer.getBoundaryForAgent("other-agent");
       expect(b).toBeNull();
     });
+
+    it("returns the same result on repeated lookups", () => {
+      const boundaries: BoundaryConfig[] = [
+        { pattern: "worker-*", allowed_paths: [], forbidden_paths: [], enforcement: "advisory" },
+      ];
+      const enforcer = new BoundaryEnforcer(db, sessionId, projectRoot, boundaries);
+      expect(enforcer.getBoundaryForAgent("worker-1")).toBe(boundaries[0]);
+      expect(enforcer.getBoundaryForAgent("worker-1")).toBe(boundaries[0]);
+      expect(enforcer.getBoundaryForAgent("lead")).toBeNull();
+      expect(enforcer.getBoundaryForAgent("lead")).toBeNull();
+    });
   });
 
   describe("checkPathAllowed", () => {
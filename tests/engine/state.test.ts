@@ -85,19 +85,35 @@ describe("StateManager", () => {
 
     it("markSessionActive updates state", () => {
       const session = state.createSession({ objective: "mark active" });
-      state.markSessionActive(session.id);
-      const found = state.getSession(session.id);
-      expect(found!.state).toBe("active");
+      const updated = state.markSessionActive(session.id);
+      expect(updated!.state).toBe("active");
+      expect(state.getSession(session.id)!.state).toBe("active");
+    });
+
+    it("session transitions return the updated row", () => {
+      const session = state.createSession({ objective: "transitions" });
+      expect(state.markSessionActive(session.id)!.state).toBe("active");
+      const paused = state.markSessionPaused(session.id);
+      expect(paused!.id).toBe(session.id);
+      expect(paused!.state).toBe("paused");
+      expect(state.markSessionActive("nonexistent")).toBeNull();
     });
 
     it("markSessionCompleted sets ended_at and state", () => {
       const session = state.createSession({ objective: "complete test" });
-      state.markSessionCompleted(session.id, "Done.");
+      const completed = state.markSessionCompleted(session.id, "Done.");
+      expect(completed!.state).toBe("completed");
+      expect(completed!.endedAt).not.toBeNull();
+      expect(completed!.contextSummary).toBe("Done.");
       const found = state.getSession(session.id);
-      expect(found!.state).toBe("completed");
-      expect(found!.endedAt).not.toBeNull();
       expect(found!.contextSummary).toBe("Done.");
     });
+
+    it("markSessionCompleted without a summary keeps the existing one", () => {
+      const session = state.createSession({ objective: "keep summary" });
+      state.markSessionCompleted(session.id, "First.");
+      expect(state.markSessionCompleted(session.id)!.contextSummary).toBe("First.");
+    });
   });
 
   describe("agents", () => {
@@ -191,12 +207,26 @@ describe("StateManager", () => {
     });
 
     it("loadAllContext returns all entries for session", () => {
-      state.saveContext({ sessionId, key: "k1", value: "v1" });
-      state.saveContext({ sessionId, key: "k2", value: "v2" });
+      state.saveContextMany(sessionId, [
+        { key: "k1", value: "v1" },
+        { key: "k2", value: "v2" },
+      ]);
       const all = state.loadAllContext(sessionId);
       expect(all.length).toBeGreaterThanOrEqual(2);
     });
 
+    it("saveContextMany replaces existing keys", () => {
+      state.saveContext({ sessionId, key: "batch", value: "old" });
+      const saved = state.saveContextMany(sessionId, [
+        { key: "batch", value: "new" },
+        { key: "batch-2", value: "other", agentId: "agent-x" },
+      ]);
+      expect(saved).toHaveLength(2);
+      expect(state.loadContext(sessionId, "batch")!.value).toBe("new");
+      expect(state.loadContext(sessionId, "batch-2")!.agentId).toBe("agent-x");
+      expect(state.saveContextMany(sessionId, [])).toEqual([]);
+    });
+
     it("deleteContext removes entry", () => {
       state.saveContext({ sessionId, key: "to-delete", value: "x" });
       state.deleteContext(sessionId, "to-delete");
@@ -210,12 +240,35 @@ describe("StateManager", () => {
     });
 
     it("returns markdown with objective and context for known session", () => {
-      const session = state.createSession({ objective: "resume test" });
-      state.saveContext({ sessionId: session.id, key: "ctx", value: "data" });
+      // Seed everything under one write transaction: one commit instead
+      // of one per insert.
+      const session = db.transactionImmediate(() => {
+        const s = state.createSession({ objective: "resume test" });
+        state.registerAgent({ sessionId: s.id, name: "auth-dev", role: "lead" });
+        state.saveContext({ sessionId: s.id, key: "ctx", value: "data" });
+        state.markSessionCompleted(s.id, "progress");
+        return s;
+      });
       const text = state.generateResumeContext(session.id);
       expect(text).toContain("resume test");
       expect(text).toContain("Previous Session Context");
+      expect(text).toContain("auth-dev");
+      expect(text).toContain("progress");
       expect(text).toContain("ctx");
     });
+
+    it("renders only the first ten context entries by key", () => {
+      const session = state.createSession({ objective: "many entries" });
+      state.saveContextMany(
+        session.id,
+        Array.from({ length: 12 }, (_, i) => ({
+          key: `key-${String(i).padStart(2, "0")}`,
+          value: `value ${i}`,
+        })),
+      );
+      const text = state.generateResumeContext(session.id);
+      expect(text).toContain("**key-09**");
+      expect(text).not.toContain("**key-10**");
+    });
   });
 });
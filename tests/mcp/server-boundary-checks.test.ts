@@ -0,0 +1,69 @@
+/**
+ * Tests for MCP boundary checks against the current filesystem.
+ */
+
+import { mkdirSync, mkdtempSync, rmSync, symlinkSync, writeFileSync } from "node:fs";
+import os from "node:os";
+import path from "node:path";
+import { describe, it, expect, beforeAll, afterAll } from "vitest";
+import { Db } from "../../src/store/db.js";
+import { StateManager } from "../../src/engine/state.js";
+import { K6sServer } from "../../src/mcp/server.js";
+import { K6sConfigSchema } from "../../src/models/config.js";
+import { getTempDbPath, cleanupTempDir } from "../helpers.js";
+
+type ToolHandlers = Record<
+  string,
+  {
+    handler: (
+      args: Record<string, unknown>,
+    ) => Promise<{ content: Array<{ type: string; text: string }> }>;
+  }
+>;
+
+describe("K6sServer boundary checks", () => {
+  let db: Db;
+  let sessionId: string;
+  let projectRoot: string;
+  let outsideDir: string;
+
+  beforeAll(() => {
+    projectRoot = mkdtempSync(path.join(os.tmpdir(), "k6s-mcp-boundary-"));
+    outsideDir = mkdtempSync(path.join(os.tmpdir(), "k6s-mcp-outside-"));
+    db = new Db(getTempDbPath());
+    db.connect();
+    const state = new StateManager(db, projectRoot);
+    sessionId = state.createSession({ objective: "boundary check test" }).id;
+  });
+
+  afterAll(() => {
+    db.close();
+    cleanupTempDir();
+    rmSync(projectRoot, { recursive: true, force: true });
+    rmSync(outsideDir, { recursive: true, force: true });
+  });
+
+  it("re-evaluates k6s_check_path after a path becomes a symlink", async () => {
+    const config = K6sConfigSchema.parse({
+      project: { name: "test" },
+      boundaries: [{ pattern: "*", forbidden_paths: [".env*"] }],
+    });
+    const server = new K6sServer(db, config, sessionId, projectRoot);
+    const tools = (server as unknown as { mcp: { _registeredTools: ToolHandlers } })
+      .mcp._registeredTools;
+
+    mkdirSync(path.join(projectRoot, "src"));
+    const target = path.join(projectRoot, "src", "x");
+    writeFileSync(target, "ok");
+    const before = await tools.k6s_check_path.handler({ path: "src/x", agent_name: "a" });
+    expect(JSON.parse(before.content[0].text).allowed).toBe(true);
+
+    rmSync(target);
+    writeFileSync(path.join(outsideDir, "secret"), "s");
+    symlinkSync(path.join(outsideDir, "secret"), target);
+    const after = await tools.k6s_check_path.handler({ path: "src/x", agent_name: "a" });
+    const result = JSON.parse(after.content[0].text);
+    expect(result.allowed).toBe(false);
+    expect(result.reason).toMatch(/outside project root/);
+  });
+});
@@ -0,0 +1,69 @@
+/**
+ * Tests for per-tool MCP input limit validation.
+ */
+
+import { describe, it, expect, beforeAll, afterAll } from "vitest";
+import { Db } from "../../src/store/db.js";
+import { StateManager } from "../../src/engine/state.js";
+import { K6sServer } from "../../src/mcp/server.js";
+import { K6sConfigSchema } from "../../src/models/config.js";
+import { getTempDbPath, cleanupTempDir } from "../helpers.js";
+
+type ToolHandlers = Record<
+  string,
+  {
+    handler: (
+      args: Record<string, unknown>,
+    ) => Promise<{ content: Array<{ type: string; text: string }> }>;
+  }
+>;
+
+describe("K6sServer input limits", () => {
+  let db: Db;
+  let tools: ToolHandlers;
+  const projectRoot = "/tmp/k6s-mcp-input-limits-test";
+
+  beforeAll(() => {
+    db = new Db(getTempDbPath());
+    db.connect();
+    const state = new StateManager(db, projectRoot);
+    const sessionId = state.createSession({ objective: "input limits test" }).id;
+    const config = K6sConfigSchema.parse({
+      project: { name: "test" },
+      boundaries: [{ pattern: "*" }],
+    });
+    const server = new K6sServer(db, config, sessionId, projectRoot);
+    tools = (server as unknown as { mcp: { _registeredTools: ToolHandlers } })
+      .mcp._registeredTools;
+  });
+
+  afterAll(() => {
+    db.close();
+    cleanupTempDir();
+  });
+
+  it("rejects an oversized action on k6s_log", async () => {
+    const res = await tools.k6s_log.handler({ action: "x".repeat(501) });
+    expect(JSON.parse(res.content[0].text).error).toContain("'action'");
+  });
+
+  it("rejects too many files on k6s_log", async () => {
+    const files = Array.from({ length: 101 }, (_, i) => `f${i}.ts`);
+    const res = await tools.k6s_log.handler({ action: "ok", files });
+    expect(JSON.parse(res.content[0].text).error).toContain("'files'");
+  });
+
+  it("rejects an out-of-range lock duration", async () => {
+    const res = await tools.k6s_acquire_lock.handler({
+      path: "src/a.ts",
+      agent_name: "primary",
+      duration_seconds: 7200,
+    });
+    expect(JSON.parse(res.content[0].text).error).toContain("'duration_seconds'");
+  });
+
+  it("accepts inputs within limits", async () => {
+    const res = await tools.k6s_log.handler({ action: "within limits" });
+    expect(JSON.parse(res.content[0].text).status).toBe("logged");
+  });
+});
@@ -7,9 +7,11 @@ import {
   AuditEventSchema,
   EventType,
   AuditSeverity,
+  AUDIT_EVENT_COLUMNS,
   auditEventToDbRow,
   auditEventFromDbRow,
   shortSummary,
+  localTimeOfDay,
   type AuditEvent,
 } from "../../src/models/audit.js";
 
@@ -76,6 +78,18 @@ describe("audit model", () => {
       expect(back.agentId).toBe(event.agentId);
       expect(back.hmac).toBe(event.hmac);
       expect(back.severity).toBe(event.severity);
+      expect(Object.keys(row)).toEqual([...AUDIT_EVENT_COLUMNS]);
+    });
+  });
+
+  describe("localTimeOfDay", () => {
+    it("matches toTimeString for valid timestamps", () => {
+      const ts = "2026-01-01T12:34:56.789Z";
+      expect(localTimeOfDay(ts)).toBe(new Date(ts).toTimeString().slice(0, 8));
+    });
+
+    it("returns a placeholder for unparseable timestamps", () => {
+      expect(localTimeOfDay("not a date")).toBe("--:--:--");
     });
   });
 
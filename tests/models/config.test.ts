@@ -1,5 +1,5 @@
 /**
- * Tests for config model: loadConfig, sanitizeConfigForStorage, resolveWebhookSecret, generateDefaultConfig.
+ * Tests for config model: loadConfig, saveConfig, sanitizeConfigForStorage, resolveWebhookSecret, generateDefaultConfig.
  */
 
 import { describe, it, expect, beforeEach, afterEach } from "vitest";
@@ -9,6 +9,8 @@ import {
   sanitizeConfigForStorage,
   resolveWebhookSecret,
   generateDefaultConfig,
+  configToYaml,
+  saveConfig,
   K6sConfigSchema,
   type K6sConfig,
 } from "../../src/models/config.js";
@@ -93,6 +95,17 @@ boundaries:
       writeFileSync(configPath, "invalid: yaml: [[[");
       expect(() => loadConfig(configPath)).toThrow();
     });
+
+    it("returns independent copies and picks up file changes", () => {
+      const configPath = path.join(tempDir, "k6s.yaml");
+      writeFileSync(configPath, "version: '1'\nproject:\n  name: first\n");
+      const a = loadConfig(configPath);
+      a.project.name = "mutated";
+      expect(loadConfig(configPath).project.name).toBe("first");
+
+      writeFileSync(configPath, "version: '1'\nproject:\n  name: second-name\n");
+      expect(loadConfig(configPath).project.name).toBe("second-name");
+    });
   });
 
   describe("loadConfigOrDefault", () => {
@@ -161,5 +174,24 @@ boundaries:
       expect(wildcard).toBeDefined();
       expect(wildcard!.forbidden_paths).toContain(".env*");
     });
+
+    it("returns independent copies on repeated calls", () => {
+      const first = generateDefaultConfig("first");
+      first.boundaries[0].forbidden_paths.push("secrets/**");
+      const second = generateDefaultConfig("second");
+      expect(second.project.name).toBe("second");
+      expect(first.project.name).toBe("first");
+      expect(second.boundaries[0].forbidden_paths).not.toContain("secrets/**");
+    });
+  });
+
+  describe("saveConfig", () => {
+    it("writes YAML that loads back to the same config, in key order", () => {
+      const config = generateDefaultConfig("round-trip");
+      const filePath = path.join(tempDir, "k6s.yaml");
+      saveConfig(config, filePath);
+      expect(loadConfig(filePath)).toEqual(config);
+      expect(configToYaml(config).startsWith("version:")).toBe(true);
+    });
   });
 });
@@ -9,6 +9,7 @@ import {
   fileLockToDbRow,
   fileLockFromDbRow,
   isLockExpired,
+  BOUNDARY_VIOLATION_COLUMNS,
   boundaryViolationToDbRow,
   boundaryViolationFromDbRow,
   type ContextEntry,
@@ -87,6 +88,7 @@ describe("context model", () => {
       const back = boundaryViolationFromDbRow(row);
       expect(back.filePath).toBe(v.filePath);
       expect(back.details).toBe(v.details);
+      expect(Object.keys(row)).toEqual([...BOUNDARY_VIOLATION_COLUMNS]);
     });
   });
 });
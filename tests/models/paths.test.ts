@@ -0,0 +1,17 @@
+/**
+ * Tests for shared path normalization.
+ */
+
+import path from "node:path";
+import { describe, it, expect } from "vitest";
+import { toPosixPath } from "../../src/models/paths.js";
+
+describe("toPosixPath", () => {
+  it("joins native path segments with forward slashes", () => {
+    expect(toPosixPath(path.join("src", "auth", "token.ts"))).toBe("src/auth/token.ts");
+  });
+
+  it("leaves forward-slash paths unchanged", () => {
+    expect(toPosixPath("lib/index.ts")).toBe("lib/index.ts");
+  });
+});
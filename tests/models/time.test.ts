@@ -0,0 +1,24 @@
+/**
+ * Tests for shared timestamp formatting.
+ */
+
+import { describe, it, expect } from "vitest";
+import { formatIsoTimestamp, nowIso } from "../../src/models/time.js";
+
+describe("formatIsoTimestamp", () => {
+  it("matches Date#toISOString output", () => {
+    const ms = Date.UTC(2030, 0, 2, 3, 4, 5, 67);
+    expect(formatIsoTimestamp(ms)).toBe(new Date(ms).toISOString());
+    expect(formatIsoTimestamp(ms + 900)).toBe(new Date(ms + 900).toISOString());
+    expect(formatIsoTimestamp(ms + 1_000)).toBe(new Date(ms + 1_000).toISOString());
+  });
+});
+
+describe("nowIso", () => {
+  it("returns a parseable ISO-8601 UTC timestamp", () => {
+    const before = Date.now();
+    const ts = nowIso();
+    expect(ts).toMatch(/^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z$/);
+    expect(Date.parse(ts)).toBeGreaterThanOrEqual(before);
+  });
+});
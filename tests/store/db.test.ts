@@ -8,6 +8,7 @@ import { getTempDbPath, cleanupTempDir } from "../helpers.js";
 import { sessionToDbRow } from "../../src/models/session.js";
 import type { Session } from "../../src/models/session.js";
 import { ulid } from "ulid";
+import { chmodSync, statSync } from "node:fs";
 
 describe("Db", () => {
   let db: Db;
@@ -36,6 +37,36 @@ describe("Db", () => {
       expect(row?.v).toBe(db.schemaVersion);
     });
 
+    it("records each migration once when a second handle opens the file", () => {
+      const other = new Db(dbPath);
+      other.connect();
+      other.close();
+      const row = db.fetchOne(
+        "SELECT COUNT(*) as c, COUNT(DISTINCT version) as d FROM schema_migrations",
+      );
+      expect(row?.c).toBe(row?.d);
+      expect(row?.c).toBe(db.schemaVersion);
+    });
+
+    it("applies connection pragmas", () => {
+      expect(db.db.pragma("journal_mode", { simple: true })).toBe("wal");
+      expect(db.db.pragma("synchronous", { simple: true })).toBe(2);
+      expect(db.db.pragma("busy_timeout", { simple: true })).toBe(5000);
+      expect(db.db.pragma("cache_size", { simple: true })).toBe(-64000);
+      // temp_store: 2 = MEMORY.
+      expect(db.db.pragma("temp_store", { simple: true })).toBe(2);
+    });
+
+    it("mirrors the applied schema version in PRAGMA user_version", () => {
+      expect(db.db.pragma("user_version", { simple: true })).toBe(db.schemaVersion);
+      db.db.pragma("user_version = 0");
+      db.close();
+      db.connect();
+      expect(db.db.pragma("user_version", { simple: true })).toBe(db.schemaVersion);
+      const row = db.fetchOne("SELECT COUNT(*) as c FROM schema_migrations");
+      expect(row?.c).toBe(db.schemaVersion);
+    });
+
     it("includes tool_call_count column on agents table", () => {
       const rows = db.fetchAll("PRAGMA table_info(agents)");
       const names = rows.map((r) => String(r.name));
@@ -53,6 +84,13 @@ describe("Db", () => {
       const row = db.fetchOne("SELECT 2 as v");
       expect(row?.v).toBe(2);
     });
+
+    it("restores owner-only permissions on an existing database file", () => {
+      db.close();
+      chmodSync(dbPath, 0o644);
+      db.connect();
+      expect(statSync(dbPath).mode & 0o777).toBe(0o600);
+    });
   });
 
   describe("insert", () => {
@@ -138,6 +176,16 @@ describe("Db", () => {
       expect(rows.length).toBeGreaterThanOrEqual(1);
     });
 
+    it("fetchAllAs converts each row with the mapper", () => {
+      const ids = db.fetchAllAs(
+        "SELECT id FROM sessions WHERE state = ?",
+        ["created"],
+        (row) => String(row.id),
+      );
+      expect(ids.length).toBeGreaterThanOrEqual(1);
+      expect(ids.every((id) => typeof id === "string")).toBe(true);
+    });
+
     it("fetchAll with params works", () => {
       const rows = db.fetchAll(
         "SELECT id FROM sessions WHERE state = ?",
@@ -145,6 +193,32 @@ describe("Db", () => {
       );
       expect(rows.some((r) => r.id)).toBe(true);
     });
+
+    it("session listings read in index order without a sort step", () => {
+      const queries: Array<[sql: string, params: unknown[]]> = [
+        ["SELECT * FROM sessions ORDER BY started_at DESC LIMIT ? OFFSET ?", [10, 0]],
+        [
+          "SELECT * FROM sessions WHERE state = ? ORDER BY started_at DESC LIMIT ? OFFSET ?",
+          ["created", 10, 0],
+        ],
+      ];
+      for (const [sql, params] of queries) {
+        const details = db
+          .fetchAll(`EXPLAIN QUERY PLAN ${sql}`, params)
+          .map((step) => String(step.detail));
+        expect(details.some((d) => d.includes("USING INDEX idx_sessions_"))).toBe(true);
+        expect(details.some((d) => d.includes("TEMP B-TREE"))).toBe(false);
+      }
+    });
+
+    it("reuses read statements with fresh parameters and after reconnect", () => {
+      const sql = "SELECT ? as v";
+      expect(db.fetchOne(sql, [1])?.v).toBe(1);
+      expect(db.fetchOne(sql, [2])?.v).toBe(2);
+      expect(db.fetchAll(sql, [3])).toEqual([{ v: 3 }]);
+      db.close();
+      expect(db.fetchOne(sql, [4])?.v).toBe(4);
+    });
   });
 
   describe("update", () => {
@@ -168,6 +242,37 @@ describe("Db", () => {
         ),
       ).toThrow(/unknown table/);
     });
+
+    it("reuses cached statements across calls and reconnects", () => {
+      const sid = ulid();
+      db.insert("sessions", {
+        id: sid,
+        objective: "statement cache",
+        state: "created",
+        started_at: new Date().toISOString(),
+      });
+      expect(db.update("sessions", { state: "active" }, "id = ?", [sid])).toBe(1);
+      db.close();
+      expect(db.update("sessions", { state: "completed" }, "id = ?", [sid])).toBe(1);
+      const row = db.fetchOne("SELECT state FROM sessions WHERE id = ?", [sid]);
+      expect(row?.state).toBe("completed");
+    });
+  });
+
+  describe("updateReturning", () => {
+    it("returns the updated row, or undefined when nothing matched", () => {
+      const sid = ulid();
+      db.insert("sessions", {
+        id: sid,
+        objective: "update returning",
+        state: "created",
+        started_at: new Date().toISOString(),
+      });
+      const sql = "UPDATE sessions SET state = ? WHERE id = ? RETURNING id, state";
+      expect(db.updateReturning(sql, ["active", sid])).toEqual({ id: sid, state: "active" });
+      expect(db.updateReturning(sql, ["paused", sid])?.state).toBe("paused");
+      expect(db.updateReturning(sql, ["active", "missing"])).toBeUndefined();
+    });
   });
 
   describe("delete", () => {
@@ -186,6 +291,78 @@ describe("Db", () => {
     });
   });
 
+  describe("insertColumns", () => {
+    const columns = Object.freeze(["key", "session_id", "value", "updated_at"]);
+
+    it("inserts values in the fixed column order and ignores extra keys", () => {
+      const sid = ulid();
+      db.insert("sessions", {
+        id: sid,
+        objective: "insertColumns test",
+        state: "created",
+        started_at: new Date().toISOString(),
+      });
+      for (const key of ["a", "b"]) {
+        db.insertColumns("context_store", columns, {
+          value: `v-${key}`,
+          key,
+          extra: "ignored",
+          updated_at: new Date().toISOString(),
+          session_id: sid,
+        });
+      }
+      const stored = db.fetchAll(
+        "SELECT key, value FROM context_store WHERE session_id = ? ORDER BY key",
+        [sid],
+      );
+      expect(stored).toEqual([
+        { key: "a", value: "v-a" },
+        { key: "b", value: "v-b" },
+      ]);
+    });
+
+    it("rejects unknown columns", () => {
+      expect(() =>
+        db.insertColumns("context_store", ["key", "bogus"], { key: "k" }),
+      ).toThrow(/unknown column/);
+    });
+  });
+
+  describe("insertMany", () => {
+    it("inserts all rows in one call and returns the count", () => {
+      const sid = ulid();
+      db.insert("sessions", {
+        id: sid,
+        objective: "insertMany test",
+        state: "created",
+        started_at: new Date().toISOString(),
+      });
+      const rows = ["a", "b", "c"].map((key) => ({
+        key,
+        session_id: sid,
+        agent_id: null,
+        value: `v-${key}`,
+        updated_at: new Date().toISOString(),
+      }));
+      expect(db.insertMany("context_store", rows)).toBe(3);
+      const stored = db.fetchAll(
+        "SELECT key FROM context_store WHERE session_id = ? ORDER BY key",
+        [sid],
+      );
+      expect(stored.map((r) => r.key)).toEqual(["a", "b", "c"]);
+    });
+
+    it("returns 0 for an empty batch", () => {
+      expect(db.insertMany("context_store", [])).toBe(0);
+    });
+
+    it("rejects unknown columns before writing", () => {
+      expect(() =>
+        db.insertMany("context_store", [{ key: "k", bogus: 1 }]),
+      ).toThrow(/unknown column/);
+    });
+  });
+
   describe("insertOrReplace", () => {
     it("inserts or replaces row", () => {
       const sessionIdForContext = ulid();
@@ -278,6 +455,17 @@ describe("Db", () => {
       ]);
       expect(row).toBeUndefined();
     });
+
+    it("transactionImmediate supports nesting and returns the inner value", () => {
+      const result = db.transactionImmediate(() =>
+        db.transactionImmediate(() => {
+          const r = db.fetchOne("SELECT 7 as v");
+          return r?.v as number;
+        }),
+      );
+      expect(result).toBe(7);
+      expect(db.db.inTransaction).toBe(false);
+    });
   });
 });
 
@@ -4,6 +4,7 @@
 
 import { describe, it, expect, beforeAll, afterAll } from "vitest";
 import { Db } from "../../src/store/db.js";
+import { SCHEMA_VERSION } from "../../src/store/migrations.js";
 import { getTempDbPath, cleanupTempDir } from "../helpers.js";
 
 describe("migration v7", () => {
@@ -61,7 +62,8 @@ describe("migration v7", () => {
     expect(indexes).toHaveLength(1);
   });
 
-  it("schema version is 8", () => {
-    expect(db.schemaVersion).toBe(8);
+  it("applies every migration through the current schema version", () => {
+    expect(db.schemaVersion).toBe(SCHEMA_VERSION);
+    expect(db.db.pragma("user_version", { simple: true })).toBe(SCHEMA_VERSION);
   });
 });
@@ -0,0 +1,47 @@
+/**
+ * Tests for migration v9: session state/start-time indexes.
+ */
+
+import { describe, it, expect, beforeAll, afterAll } from "vitest";
+import { Db } from "../../src/store/db.js";
+import { getTempDbPath, cleanupTempDir } from "../helpers.js";
+
+describe("migration v9", () => {
+  let db: Db;
+
+  beforeAll(() => {
+    db = new Db(getTempDbPath());
+    db.connect();
+  });
+
+  afterAll(() => {
+    db.close();
+    cleanupTempDir();
+  });
+
+  it("creates session indexes", () => {
+    const indexes = db.db
+      .prepare(
+        "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='sessions' AND name LIKE 'idx_sessions_%' ORDER BY name",
+      )
+      .all() as { name: string }[];
+    expect(indexes.map((i) => i.name)).toEqual([
+      "idx_sessions_started",
+      "idx_sessions_state_started",
+    ]);
+  });
+
+  it("active session lookup does not scan the table", () => {
+    const plan = db.db
+      .prepare(
+        "EXPLAIN QUERY PLAN SELECT * FROM sessions WHERE state IN ('created', 'active') ORDER BY started_at DESC LIMIT 1",
+      )
+      .all() as { detail: string }[];
+    expect(plan.some((p) => p.detail.includes("USING INDEX idx_sessions_"))).toBe(true);
+    expect(plan.some((p) => p.detail === "SCAN sessions")).toBe(false);
+  });
+
+  it("schema version is 9", () => {
+    expect(db.schemaVersion).toBe(9);
+  });
+});
@@ -1,11 +1,18 @@
 /**
- * Tests for ReviewPatternMatcher (gate pattern matching).
+ * Tests for ReviewPatternMatcher (gate pattern matching) and
+ * FilesystemWatcher event handling.
  */
 
-import { describe, it, expect } from "vitest";
-import { ReviewPatternMatcher } from "../../src/watcher/fs.js";
+import { EventEmitter } from "node:events";
+import path from "node:path";
+import { describe, it, expect, vi, beforeEach, afterEach } from "vitest";
+import { FilesystemWatcher, ReviewPatternMatcher } from "../../src/watcher/fs.js";
+import type { AuditLogger } from "../../src/engine/audit.js";
 import type { GateConfig } from "../../src/models/config.js";
 
+const chokidarMock = vi.hoisted(() => ({ watch: vi.fn() }));
+vi.mock("chokidar", () => ({ watch: chokidarMock.watch }));
+
 describe("ReviewPatternMatcher", () => {
   const gates: GateConfig[] = [
     {
@@ -37,6 +44,12 @@ describe("ReviewPatternMatcher", () => {
     expect(matcher.matchingRules("backend/pom.xml")).toContain("dep");
   });
 
+  it("literal patterns match only the exact path", () => {
+    const matcher = new ReviewPatternMatcher(gates);
+    expect(matcher.matchingRules("sub/package.json")).toEqual([]);
+    expect(matcher.matchingRules("package.json.bak")).toEqual([]);
+  });
+
   it("matchingRules matches security patterns", () => {
     const matcher = new ReviewPatternMatcher(gates);
     expect(matcher.matchingRules(".env")).toContain("sec");
@@ -64,4 +77,110 @@ describe("ReviewPatternMatcher", () => {
     const matcher = new ReviewPatternMatcher(emptyGates);
     expect(matcher.matchingRules("any/file.txt")).toEqual([]);
   });
+
+  it("getRule looks up a gate by id", () => {
+    const matcher = new ReviewPatternMatcher(gates);
+    expect(matcher.getRule("sec")?.name).toBe("Security");
+    expect(matcher.getRule("missing")).toBeUndefined();
+  });
+});
+
+describe("FilesystemWatcher", () => {
+  const projectRoot = path.resolve("/tmp/k6s-watcher-test");
+  let fake: EventEmitter & { close: ReturnType<typeof vi.fn> };
+  let ignored: (p: string) => boolean;
+  let log: ReturnType<typeof vi.fn>;
+  let watcher: FilesystemWatcher;
+
+  const emit = (eventName: string, rel: string) =>
+    fake.emit("all", eventName, path.join(projectRoot, rel));
+  const loggedActions = () =>
+    log.mock.calls.map(([ev]) => (ev as { action: string }).action);
+
+  beforeEach(() => {
+    fake = Object.assign(new EventEmitter(), { close: vi.fn() });
+    chokidarMock.watch.mockImplementation((_root: string, opts: { ignored: (p: string) => boolean }) => {
+      ignored = opts.ignored;
+      return fake;
+    });
+    log = vi.fn((ev) => ev);
+    watcher = new FilesystemWatcher({
+      projectRoot,
+      sessionId: "watcher-test",
+      auditLogger: { log } as unknown as AuditLogger,
+    });
+    watcher.start();
+  });
+
+  afterEach(() => {
+    watcher.stop();
+    vi.useRealTimers();
+  });
+
+  it("coalesces repeated events and flushes them on stop", () => {
+    emit("change", "src/a.ts");
+    emit("change", "src/a.ts");
+    expect(log).not.toHaveBeenCalled();
+    watcher.stop();
+    expect(loggedActions()).toEqual(["file_modify: src/a.ts"]);
+  });
+
+  it("flushes after the coalescing window", () => {
+    vi.useFakeTimers();
+    emit("add", "src/b.ts");
+    vi.advanceTimersByTime(50);
+    expect(loggedActions()).toEqual(["file_create: src/b.ts"]);
+  });
+
+  it("keeps interleaved event types for a path in arrival order", () => {
+    emit("change", "src/c.ts");
+    emit("unlink", "src/c.ts");
+    emit("add", "src/c.ts");
+    emit("change", "src/c.ts");
+    watcher.stop();
+    expect(loggedActions()).toEqual([
+      "file_modify: src/c.ts",
+      "file_delete: src/c.ts",
+      "file_create: src/c.ts",
+      "file_modify: src/c.ts",
+    ]);
+  });
+
+  it("keeps logging the rest of a batch when one event fails", () => {
+    const errorSpy = vi.spyOn(console, "error").mockImplementation(() => {});
+    log.mockImplementationOnce(() => {
+      throw new Error("SQLITE_BUSY");
+    });
+    emit("add", "src/d.ts");
+    emit("add", "src/e.ts");
+    watcher.stop();
+    expect(loggedActions()).toEqual(["file_create: src/d.ts", "file_create: src/e.ts"]);
+    expect(errorSpy).toHaveBeenCalledTimes(1);
+    errorSpy.mockRestore();
+  });
+
+  it("ignores chokidar events that have no file event type", () => {
+    emit("addDir", "src");
+    emit("unlinkDir", "src");
+    emit("ready", "");
+    watcher.stop();
+    expect(log).not.toHaveBeenCalled();
+  });
+
+  it("flushes immediately when the pending buffer is full", () => {
+    // MAX_PENDING_EVENTS in src/watcher/fs.ts.
+    for (let i = 0; i < 2048; i++) emit("add", `gen/${i}.ts`);
+    expect(log).toHaveBeenCalledTimes(2048);
+  });
+
+  it("ignores top-level tool and dependency directories only", () => {
+    const posixRoot = projectRoot.split(path.sep).join("/");
+    expect(ignored(`${posixRoot}/node_modules`)).toBe(true);
+    expect(ignored(`${posixRoot}/.git/objects/ab`)).toBe(true);
+    expect(ignored(`${posixRoot}/.khoregos`)).toBe(true);
+    expect(ignored(posixRoot)).toBe(false);
+    expect(ignored(`${posixRoot}/src/index.ts`)).toBe(false);
+    expect(ignored(`${posixRoot}/src/dist/x.js`)).toBe(false);
+    expect(ignored(`${posixRoot}/distribution`)).toBe(false);
+  });
 });